@@ -2,24 +2,28 @@
 
 Provides different ways to run the Juju command:
 
-    - Batch: 20 commands in 5 parallel
-    - Parallel: 20 in parallel
+    - Batch: 20 commands in batches of 5 parallel commands
+    - Parallel: 20 in parallel (limited by DEFAULT_PARALLEL_LIMIT)
     - Serial: 20 commands in 1 parallel
 """
+import asyncio
 import logging
 from argparse import Namespace
-from dataclasses import asdict
-from typing import Any, Dict, List
+from dataclasses import fields
+from typing import Any, Dict, List, Optional
 
 from juju_spell.commands.base import BaseJujuCommand, Result
 from juju_spell.config import Config, Controller
-from juju_spell.connections import connect_manager, get_controller
+from juju_spell.connections import get_controller
+from juju_spell.settings import DEFAULT_BATCH_SIZE, DEFAULT_PARALLEL_LIMIT
 
 logger = logging.getLogger(__name__)
 
 ResultType = Dict[str, Dict[str, Any]]
 ResultsType = List[ResultType]
 
+_RESULT_FIELDS = tuple(field.name for field in fields(Result))
+
 
 def get_result(controller_config: Controller, output: Result) -> ResultType:
     """Get command result."""
@@ -29,18 +33,99 @@ def get_result(controller_config: Controller, output: Result) -> ResultType:
             "name": controller_config.name,
             "customer": controller_config.customer,
         },
-        **asdict(output),
+        # shallow copy, the output is serialized by CLI and does not need deep copy
+        **{name: getattr(output, name) for name in _RESULT_FIELDS},
     }
 
 
+def _get_error_result(controller_config: Controller, error: Exception) -> ResultType:
+    """Convert failure on a controller to result with error."""
+    logger.error("%s failed with error: %s", controller_config.uuid, error)
+    return get_result(controller_config, Result(False, error=error))
+
+
+async def _run_on_controller(
+    controller_config: Controller, command: BaseJujuCommand, command_kwargs: Dict[str, Any]
+) -> ResultType:
+    """Run pre-check and command (or dry-run) on a single controller.
+
+    The command_kwargs are shared between all controllers and must not be modified,
+    the controller_config is passed to command as a separate argument.
+    """
+    controller = await get_controller(controller_config)
+    pre_check = await command.pre_check(
+        controller=controller, controller_config=controller_config, **command_kwargs
+    )
+
+    if pre_check is not None:
+        output = pre_check
+    elif command_kwargs["dry_run"]:
+        output = await command.dry_run(
+            controller=controller, controller_config=controller_config, **command_kwargs
+        )
+    else:
+        output = await command.run(
+            controller=controller, controller_config=controller_config, **command_kwargs
+        )
+
+    return get_result(controller_config, output)
+
+
+async def _gather(
+    controllers: List[Controller],
+    command: BaseJujuCommand,
+    command_kwargs: Dict[str, Any],
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> ResultsType:
+    """Run command on controllers concurrently.
+
+    A failure on one controller does not cancel the others, instead it's converted
+    to result with error.
+    """
+
+    async def _run(controller_config: Controller) -> ResultType:
+        if semaphore is None:
+            return await _run_on_controller(controller_config, command, command_kwargs)
+
+        async with semaphore:
+            return await _run_on_controller(controller_config, command, command_kwargs)
+
+    outputs = await asyncio.gather(
+        *(_run(controller_config) for controller_config in controllers),
+        return_exceptions=True,
+    )
+    results: ResultsType = []
+    for controller_config, output in zip(controllers, outputs):
+        if isinstance(output, Exception):
+            output = _get_error_result(controller_config, output)
+        elif isinstance(output, BaseException):
+            raise output  # e.g. KeyboardInterrupt should not be hidden
+
+        results.append(output)
+
+    return results
+
+
 async def run_parallel(
-    config: Config, command: BaseJujuCommand, parsed_args: Namespace
+    config: Config,
+    command: BaseJujuCommand,
+    parsed_args: Namespace,
+    limit: int = DEFAULT_PARALLEL_LIMIT,
 ) -> ResultsType:
     """Run controller target command in parallel.
 
-    THIS FUNCTION IS NOT YET SUPPORTED.
+    Parameters:
+        config(Config): application configuration
+        command(BaseJujuCommand): command to run
+        parsed_args(Namespace): Namespace from CLI
+        limit(int): maximum number of controllers processed at the same time
+    Returns:
+        results(Dict): Controller dict with result.
     """
-    raise NotImplementedError("running in parallel is not yet supported")
+    logger.debug("running in parallel with limit %d", limit)
+    semaphore = asyncio.Semaphore(limit)
+    command_kwargs = dict(vars(parsed_args))
+    return await _gather(config.controllers, command, command_kwargs, semaphore)
 
 
 async def run_serial(
@@ -48,6 +133,9 @@ async def run_serial(
 ) -> ResultsType:
     """Run controller target command serially.
 
+    A failure on one controller does not stop the run, instead it's converted to
+    result with error.
+
     Parameters:
         config(Config): application configuration
         command(BaseJujuCommand): command to run
@@ -56,47 +144,60 @@ async def run_serial(
         results(Dict): Controller dict with result.
     """
     results: ResultsType = []
+    command_kwargs = dict(vars(parsed_args))
     for controller_config in config.controllers:
-        controller = await get_controller(controller_config)
-        logger.debug("%s running in serial", controller.controller_uuid)
-        command_kwargs = vars(parsed_args)
-        command_kwargs["controller_config"] = controller_config
+        logger.debug("%s running in serial", controller_config.uuid)
+        try:
+            result = await _run_on_controller(controller_config, command, command_kwargs)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            result = _get_error_result(controller_config, error)
 
-        pre_check = await command.pre_check(controller=controller, **command_kwargs)
-
-        if pre_check is not None:
-            output = pre_check
-        elif parsed_args.dry_run:
-            output = await command.dry_run(controller=controller, **command_kwargs)
-        else:
-            output = await command.run(controller=controller, **command_kwargs)
-
-        result = get_result(controller_config, output)
         results.append(result)
 
     return results
 
 
 async def run_batch(
-    config: Config, command: BaseJujuCommand, parsed_args: Namespace
+    config: Config,
+    command: BaseJujuCommand,
+    parsed_args: Namespace,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> ResultsType:
     """Run controller target command in batches.
 
-    THIS FUNCTION IS NOT YET SUPPORTED.
+    Controllers in one batch are processed in parallel and the next batch starts
+    only when the previous one is done.
+
+    Parameters:
+        config(Config): application configuration
+        command(BaseJujuCommand): command to run
+        parsed_args(Namespace): Namespace from CLI
+        batch_size(int): number of controllers in one batch
+    Returns:
+        results(Dict): Controller dict with result.
     """
-    raise NotImplementedError("running in batches is not yet supported")
+    results: ResultsType = []
+    command_kwargs = dict(vars(parsed_args))
+    for start in range(0, len(config.controllers), batch_size):
+        end = start + batch_size
+        batch = config.controllers[start:end]
+        logger.debug("running batch %d with %d controllers", start // batch_size, len(batch))
+        results.extend(await _gather(batch, command, command_kwargs))
+
+    return results
 
 
 async def run(config: Config, command: BaseJujuCommand, parsed_args: Namespace) -> ResultsType:
-    """Run command on controllers."""
-    try:
-        run_type = parsed_args.run_type
-        logger.info("running with run_type: %s", run_type)
-        if run_type == "parallel":
-            return await run_parallel(config, command, parsed_args)
-        if run_type == "batch":
-            return await run_batch(config, command, parsed_args)
-
-        return await run_serial(config, command, parsed_args)
-    finally:
-        await connect_manager.clean()
+    """Run command on controllers.
+
+    Connections to controllers are not closed after the run, so they can be reused
+    by the next one. They are closed by connect_manager at interpreter exit.
+    """
+    run_type = parsed_args.run_type
+    logger.info("running with run_type: %s", run_type)
+    if run_type == "parallel":
+        return await run_parallel(config, command, parsed_args)
+    if run_type == "batch":
+        return await run_batch(config, command, parsed_args)
+
+    return await run_serial(config, command, parsed_args)
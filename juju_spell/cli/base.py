@@ -137,6 +137,11 @@ class BaseJujuCMD(BaseCMD, metaclass=ABCMeta):
 
         filtered_config = get_filtered_config(self.config, parsed_args.filter)
         loop = asyncio.get_event_loop()
+        if hasattr(asyncio, "eager_task_factory"):  # available since Python 3.12
+            # run first step of tasks synchronously, so tasks that do not need to wait
+            # for I/O (e.g. cached controller) finish without scheduling round-trips
+            loop.set_task_factory(asyncio.eager_task_factory)
+
         task = loop.create_task(run(filtered_config, self.command(), parsed_args))
         loop.run_until_complete(asyncio.gather(task))
         return task.result()
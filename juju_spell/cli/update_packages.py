@@ -15,15 +15,15 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """JujuSpell juju add user command."""
 import logging
-import os
+import re
 import textwrap
 from pathlib import Path
-from typing import List
 
 from craft_cli.dispatcher import _CustomArgumentParser
 
 from juju_spell import utils
 from juju_spell.cli.base import JujuWriteCMD
+from juju_spell.cli.utils import parse_positive_int
 from juju_spell.commands.update_packages import (
     Application,
     PackageToUpdate,
@@ -31,6 +31,7 @@ from juju_spell.commands.update_packages import (
     Updates,
 )
 from juju_spell.exceptions import JujuSpellError
+from juju_spell.settings import DEFAULT_PARALLEL_UNITS
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +64,7 @@ class UpdatePackages(JujuWriteCMD):
 
         Example:
         $ juju_spell update-packages --patch patchfile.yaml
+        $ juju_spell update-packages --patch patchfile.yaml --parallel-units 4
 
         """
     )
@@ -77,34 +79,51 @@ class UpdatePackages(JujuWriteCMD):
             help="patch file",
             required=True,
         )
+        parser.add_argument(
+            "--parallel-units",
+            type=parse_positive_int,
+            default=DEFAULT_PARALLEL_UNITS,
+            help=(
+                "Number of units updated at the same time in one model. Units are updated "
+                f"one by one by default. (default: {DEFAULT_PARALLEL_UNITS})"
+            ),
+        )
+
+
+def _is_valid_regex(expression: str) -> bool:
+    """Check if expression is a valid regular expression."""
+    try:
+        re.compile(expression)
+    except (re.error, TypeError):
+        return False
+
+    return True
 
 
 def get_patch_config(file_path: str) -> Updates:
     """Load patch config."""
     patch = utils.load_yaml_file(Path(file_path))
-    applications: List[Application] = []
     errors = []
+    applications = []
     for app in patch["applications"]:
-        packages_to_update: List[PackageToUpdate] = []
-        for package in app.get("packages_to_update", []):
-            package_to_update = PackageToUpdate(
-                package=package["app"], version=package.get("version", None)
-            )
-            packages_to_update.append(package_to_update)
-
-        dist_upgrade = app.get("dist_upgrade", False)
-        if not isinstance(dist_upgrade, bool):
+        if not isinstance(app.get("dist_upgrade", False), bool):
             errors.append(f"application['{app['application']}'].dist_upgrade should be bool")
+        if not _is_valid_regex(app["application"]):
+            errors.append(f"application['{app['application']}'] is not a valid regular expression")
+
         applications.append(
             Application(
                 name_expr=app["application"],
-                dist_upgrade=dist_upgrade,
+                dist_upgrade=app.get("dist_upgrade", False),
                 results=[],
-                packages_to_update=packages_to_update,
+                packages_to_update=[
+                    PackageToUpdate(package=package["app"], version=package.get("version", None))
+                    for package in app.get("packages_to_update", [])
+                ],
             )
         )
 
     if len(errors) > 0:
-        raise JujuSpellError(f"errors in input file:{os.linesep}{os.linesep.join(errors)}")
+        raise JujuSpellError("errors in input file:\n" + "\n".join(errors))
 
     return Updates(applications=applications)
@@ -92,7 +92,20 @@ def parse_comma_separated_str(comma_separated_str: str) -> List[str]:
 
 def parse_filter(value: str) -> str:
     """Type check for argument filter."""
-    if not (re.findall(FILTER_EXPRESSION_REGEX, value) or len(value) == 0):
+    if value and re.search(FILTER_EXPRESSION_REGEX, value) is None:
         raise ArgumentTypeError(f"Argument filter format wrong: {value}")
 
     return value
+
+
+def parse_positive_int(value: str) -> int:
+    """Type check for positive integer argument."""
+    try:
+        number = int(value)
+    except ValueError as error:
+        raise ArgumentTypeError(f"Argument must be a positive integer: {value}") from error
+
+    if number < 1:
+        raise ArgumentTypeError(f"Argument must be a positive integer: {value}")
+
+    return number
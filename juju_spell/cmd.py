@@ -1,5 +1,6 @@
 """Module combinates all the commands."""
 import argparse
+import asyncio
 import contextlib
 import inspect
 import logging
@@ -144,8 +145,25 @@ def _run_dispatcher(dispatcher: Dispatcher) -> None:
     dispatcher.run()
 
 
+def _set_event_loop() -> None:
+    """Set event loop for commands, uvloop event loop is used if it is installed.
+
+    The loop is not closed after a command, so connections to controllers can be
+    reused by the following ones.
+    """
+    try:
+        import uvloop  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    else:
+        loop = uvloop.new_event_loop()
+
+    asyncio.set_event_loop(loop)
+
+
 def exec_cmd() -> int:
     """Execute craft cli."""
+    _set_event_loop()
     dispatcher = get_dispatcher()
     return_code = 0
 
@@ -1,7 +1,8 @@
 """Command to add users."""
-from typing import Any, Dict, Optional, Union
+from __future__ import annotations
 
-from juju.controller import Controller
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from juju_spell.commands.base import BaseJujuCommand, Result
 from juju_spell.commands.enable_user import EnableUserCommand
@@ -9,12 +10,22 @@ from juju_spell.commands.grant import GrantCommand
 from juju_spell.exceptions import JujuSpellError
 from juju_spell.utils import random_password
 
+if TYPE_CHECKING:
+    from juju.controller import Controller
+
 __all__ = ["AddUserCommand"]
 
 
 class AddUserCommand(BaseJujuCommand):
     """Add user command."""
 
+    def __init__(self) -> None:
+        """Init for command."""
+        super().__init__()
+        # sub-commands are stateless, so they are created once and reused for every controller
+        self._enable_user_cmd = EnableUserCommand()
+        self._grant_cmd = GrantCommand()
+
     async def pre_check(self, controller: Controller, **kwargs: Any) -> Optional[Result]:
         if kwargs["user"] == kwargs["controller_config"].user:
             msg = "User can't add self"
@@ -31,40 +42,42 @@ class AddUserCommand(BaseJujuCommand):
         overwrite: bool = False,
         **kwargs: Any,
     ) -> Union[Dict[str, str], Result]:
+        username = kwargs["user"]
+        controller_uuid = controller.controller_uuid
+
         password = kwargs["password"]
         if len(password) == 0:
             password = random_password()
 
-        user = await controller.get_user(username=kwargs["user"])
+        user = await controller.get_user(username=username)
         if user is None:  # User does not exists
             user = await controller.add_user(
-                username=kwargs["user"],
+                username=username,
                 password=password,
                 display_name=kwargs["display_name"],
             )
-            self.logger.info("%s create user %s", controller.controller_uuid, kwargs["user"])
+            self.logger.info("%s create user %s", controller_uuid, username)
         if overwrite:
             await user.set_password(password)  # Reset user's password
             self.logger.info(
                 "%s reset user %s password",
-                controller.controller_uuid,
-                kwargs["user"],
+                controller_uuid,
+                username,
             )
 
-        enable_cmd = EnableUserCommand()
-        enable_cmd_result = await enable_cmd.run(
-            controller=controller, overwrite=overwrite, **kwargs
-        )
-        if not enable_cmd_result.success and not overwrite:
-            return enable_cmd_result
-
+        # enable user and grant permissions are independent, so they run concurrently
+        sub_commands = [
+            self._enable_user_cmd.run(controller=controller, overwrite=overwrite, **kwargs)
+        ]
         if kwargs.get("acl"):
-            grant_cmd = GrantCommand()
-            grant_cmd_result: Result = await grant_cmd.run(
-                controller=controller, overwrite=overwrite, **kwargs
+            sub_commands.append(
+                self._grant_cmd.run(controller=controller, overwrite=overwrite, **kwargs)
             )
-            if not grant_cmd_result.success and not overwrite:
-                return grant_cmd_result
+
+        results: List[Result] = await asyncio.gather(*sub_commands)
+        for result in results:
+            if not result.success and not overwrite:
+                return result
 
         return {
             "user": user.username,
@@ -15,15 +15,23 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """JujuSpell base juju command."""
+from __future__ import annotations
+
 import dataclasses
 import logging
+import time
 from abc import ABCMeta, abstractmethod
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
-
-from juju.controller import Controller
-from juju.model import Model
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 from juju_spell.exceptions import JujuSpellError
+from juju_spell.settings import DEFAULT_MODELS_CACHE_TTL
+
+if TYPE_CHECKING:
+    from juju.controller import Controller
+    from juju.model import Model
+
+# models listed on controllers in this process, {(controller_uuid, user): (timestamp, names)}
+_models_cache: Dict[Tuple[str, str], Tuple[float, List[str]]] = {}
 
 
 @dataclasses.dataclass(frozen=True)
@@ -48,20 +56,48 @@ class BaseJujuCommand(metaclass=ABCMeta):
         controller: Controller,
         model_mappings: Dict[str, List[str]],
         models: Optional[List[str]] = None,
+        refresh: bool = False,
     ) -> List[str]:
         """Get filtered model names for controller.
 
         If models is None, then all model names for controller will be
         returned.  If the model_mapping[model] exits for specific model it will
         be replaced by the list of values from model_mapping[model] from
-        config.
+        config. The list of all models is reused for DEFAULT_MODELS_CACHE_TTL
+        seconds, unless refresh is True.
         """
-        if models is None or len(models) <= 0:
-            all_models = await controller.list_models()
-        else:
-            all_models = _apply_model_mappings(models, model_mappings)
+        if models:
+            # mapping does not need the controller, so it's not cached
+            return _apply_model_mappings(models, model_mappings)
+
+        # listed models depend on the user's access, so the user is part of the key
+        key = (controller.controller_uuid, controller.get_current_username())
+        cached = _models_cache.get(key)
+        if not refresh and cached is not None:
+            timestamp, model_names = cached
+            if time.monotonic() - timestamp <= DEFAULT_MODELS_CACHE_TTL:
+                return list(model_names)
+
+        all_models = await controller.list_models()
+        _models_cache[key] = (time.monotonic(), list(all_models))
         return all_models
 
+    async def get_filtered_model_uuids(
+        self,
+        controller: Controller,
+        model_mappings: Dict[str, List[str]],
+        models: Optional[List[str]] = None,
+    ) -> List[str]:
+        """Get filtered model UUIDs for controller.
+
+        The models are filtered the same way as in get_filtered_model_names, but
+        the UUIDs are resolved with a single call instead of connecting to each
+        model. Unknown names are used as UUIDs the same way as in get_model.
+        """
+        model_names = await self.get_filtered_model_names(controller, model_mappings, models)
+        uuids = await controller.model_uuids()
+        return [uuids.get(model_name, model_name) for model_name in model_names]
+
     async def get_filtered_models(
         self,
         controller: Controller,
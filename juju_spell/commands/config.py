@@ -1,16 +1,20 @@
 """Config command for juju-spell."""
+from __future__ import annotations
+
 import dataclasses
 import logging
-from typing import Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Union
 
 from craft_cli import emit
-from juju.application import Application
-from juju.controller import Controller
-from juju.model import Model
 from websockets.exceptions import InvalidStatusCode
 
 from juju_spell.commands.base import BaseJujuCommand
 
+if TYPE_CHECKING:
+    from juju.application import Application
+    from juju.controller import Controller
+    from juju.model import Model
+
 logger = logging.getLogger()
 
 
@@ -14,13 +14,17 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Command to enable users."""
-from typing import Any, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
 
-from juju.controller import Controller
 from juju.errors import JujuError
 
 from juju_spell.commands.base import BaseJujuCommand
 
+if TYPE_CHECKING:
+    from juju.controller import Controller
+
 __all__ = ["EnableUserCommand", "DisableUserCommand"]
 
 
@@ -34,18 +38,19 @@ class EnableUserCommand(BaseJujuCommand):
         **kwargs: Any,
     ) -> bool:
         """Execute."""
+        username = kwargs["user"]
         try:
             self.logger.info(
                 "%s start enable user %s",
                 controller.controller_uuid,
-                kwargs["user"],
+                username,
             )
-            await controller.enable_user(username=kwargs["user"])
+            await controller.enable_user(username=username)
         except JujuError as err:
             self.logger.info(
                 "%s start enable user %s fail",
                 controller.controller_uuid,
-                kwargs["user"],
+                username,
             )
             if not overwrite:
                 raise err
@@ -67,14 +72,14 @@ class DisableUserCommand(BaseJujuCommand):
             self.logger.info(
                 "%s start disable user %s",
                 controller.controller_uuid,
-                kwargs["user"],
+                user,
             )
             await controller.disable_user(username=user)
         except JujuError as err:
             self.logger.warning(
                 "%s disable user %s fail",
                 controller.controller_uuid,
-                kwargs["user"],
+                user,
             )
             if not overwrite:
                 raise err
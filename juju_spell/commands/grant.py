@@ -14,13 +14,17 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Command to grant permission for user."""
-from typing import Any, List, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List, Optional
 
-from juju.controller import Controller
 from juju.errors import JujuError
 
 from juju_spell.commands.base import BaseJujuCommand
 
+if TYPE_CHECKING:
+    from juju.controller import Controller
+
 __all__ = ["GrantCommand", "ACL_CHOICES"]
 
 CONTROLLER_ACL_CHOICES = ["login", "add-model", "superuser"]
@@ -28,13 +32,16 @@ MODEL_ACL_CHOICES = ["read", "write", "admin"]
 
 ACL_CHOICES = CONTROLLER_ACL_CHOICES + MODEL_ACL_CHOICES
 
+_CONTROLLER_ACL = frozenset(CONTROLLER_ACL_CHOICES)
+_MODEL_ACL = frozenset(MODEL_ACL_CHOICES)
+
 
 class GrantCommand(BaseJujuCommand):
     """Grant permission for user."""
 
     def get_controller_acl(self, acl: str) -> str:
         """Get corresponding controller acl from input acl."""
-        if acl in CONTROLLER_ACL_CHOICES:
+        if acl in _CONTROLLER_ACL:
             controller_acl = acl
         else:
             controller_acl = "login"
@@ -42,7 +49,7 @@ class GrantCommand(BaseJujuCommand):
 
     def get_model_acl(self, acl: str) -> str:
         """Get corresponding model acl from input acl."""
-        if acl in MODEL_ACL_CHOICES:
+        if acl in _MODEL_ACL:
             model_acl = acl
         elif acl == "superuser":
             model_acl = "admin"
@@ -50,6 +57,28 @@ class GrantCommand(BaseJujuCommand):
             model_acl = "read"
         return model_acl
 
+    @staticmethod
+    async def grant_models(
+        controller: Controller, username: str, model_uuids: List[str], acl: str
+    ) -> None:
+        """Grant user access to multiple models with a single API call.
+
+        This is a bulk version of Controller.grant_model. Each change is applied
+        independently, so failure of one model does not affect the others, and
+        the errors of all failed models are raised together as JujuError.
+        """
+        # juju.client is imported lazily, since it's slow to import
+        from juju import tag  # pylint: disable=import-outside-toplevel
+        from juju.client import client  # pylint: disable=import-outside-toplevel
+
+        user = tag.user(username)
+        changes = [
+            client.ModifyModelAccess(acl, "grant", tag.model(model_uuid), user)
+            for model_uuid in model_uuids
+        ]
+        model_facade = client.ModelManagerFacade.from_connection(controller.connection())
+        await model_facade.ModifyModelAccess(changes=changes)
+
     async def execute(
         self,
         controller: Controller,
@@ -59,44 +88,46 @@ class GrantCommand(BaseJujuCommand):
     ) -> bool:
         """Execute."""
         acl = kwargs["acl"]
+        username = kwargs["user"]
+        controller_uuid = controller.controller_uuid
 
         controller_acl: str = self.get_controller_acl(acl)
         model_acl: str = self.get_model_acl(acl)
 
         self.logger.info(
             "%s Start grant permission %s for user %s",
-            controller.controller_uuid,
+            controller_uuid,
             controller_acl,
-            kwargs["user"],
+            username,
         )
-        await controller.grant(username=kwargs["user"], acl=controller_acl)
+        await controller.grant(username=username, acl=controller_acl)
 
-        async for _, model in self.get_filtered_models(
+        model_uuids = await self.get_filtered_model_uuids(
             controller=controller,
             models=models,
             model_mappings=kwargs["controller_config"].model_mapping,
-        ):
-            try:
-                self.logger.info(
-                    "%s Start grant model %s permission %s for user %s",
-                    controller.controller_uuid,
-                    model.uuid,
-                    model_acl,
-                    kwargs["user"],
-                )
-                await controller.grant_model(
-                    username=kwargs["user"],
-                    model_uuid=model.uuid,
-                    acl=model_acl,
-                )
-            except JujuError as err:
-                self.logger.info(
-                    "%s Grant model %s permission %s for user %s fail",
-                    controller.controller_uuid,  # pylint: disable=duplicate-code
-                    model.uuid,
-                    model_acl,
-                    kwargs["user"],
-                )
-                if not overwrite:
-                    raise err
+        )
+        if not model_uuids:
+            return True
+
+        try:
+            self.logger.info(
+                "%s Start grant models %s permission %s for user %s",
+                controller_uuid,
+                model_uuids,
+                model_acl,
+                username,
+            )
+            await self.grant_models(controller, username, model_uuids, model_acl)
+        except JujuError as err:
+            self.logger.info(
+                "%s Grant models permission %s for user %s fail: %s",
+                controller_uuid,  # pylint: disable=duplicate-code
+                model_acl,
+                username,
+                err,
+            )
+            if not overwrite:
+                raise err
+
         return True
@@ -1,14 +1,21 @@
 """List models from the local cache or from the controllers."""
+from __future__ import annotations
+
+import dataclasses
 from logging import Logger
 from time import time
-from typing import Any, Dict, List, Union
-
-from juju.controller import Controller
+from typing import TYPE_CHECKING, Any, Dict, List, Union
 
 from juju_spell.commands.base import BaseJujuCommand
 from juju_spell.exceptions import JujuSpellError
 from juju_spell.utils import Cache, load_from_cache, save_to_cache
 
+if TYPE_CHECKING:
+    from juju.controller import Controller
+
+# caches loaded or saved by this process, so each cache file is read at most once
+_memory_cache: Dict[str, Cache] = {}
+
 
 class ListModelsCommand(BaseJujuCommand):
     """Command to list models from the local cache or from the controllers."""
@@ -16,22 +23,25 @@ class ListModelsCommand(BaseJujuCommand):
     async def execute(self, controller: Controller, **kwargs: Any) -> Dict[str, Union[List, bool]]:
         """List models from the local cache or from the controllers."""
         cache: Union[None, Cache] = None
+        controller_config = kwargs["controller_config"]
+        refresh = kwargs["refresh"]
 
-        if not kwargs["refresh"]:
-            fname = f"{self.name}_{kwargs['controller_config'].uuid}"
-            cache = load_cache_data(fname, self.logger, kwargs["controller_config"].uuid)
+        if not refresh:
+            fname = f"{self.name}_{controller_config.uuid}"
+            cache = load_cache_data(fname, self.logger, controller_config.uuid)
 
-        if kwargs["refresh"] or cache is None:
+        if refresh or cache is None:
             models = list(
                 await self.get_filtered_model_names(
                     controller=controller,
                     models=None,
-                    model_mappings=kwargs["controller_config"].model_mapping,
+                    model_mappings=controller_config.model_mapping,
+                    refresh=refresh,
                 )
             )
-            cache = save_cache_data(controller, models, kwargs["refresh"], self.logger, self.name)
+            cache = save_cache_data(controller, models, refresh, self.logger, self.name)
 
-        self.logger.debug("%s list models: %s", controller.controller_uuid, cache.data["models"])
+        self.logger.debug("%s list models: %s", cache.uuid, cache.data["models"])
         return cache.context
 
 
@@ -39,8 +49,9 @@ def save_cache_data(
     controller: Controller, models: List[str], refresh: bool, logger: Logger, command_name: str
 ) -> Cache:
     """Gracefully save cache data to default cache directory."""
+    uuid = controller.controller_uuid
     cache = Cache(
-        uuid=controller.controller_uuid,
+        uuid=uuid,
         name=controller.controller_name,
         data={
             "models": models,
@@ -48,26 +59,30 @@ def save_cache_data(
         },
         timestamp=time(),
     )
-    fname = f"{command_name}_{controller.controller_uuid}"
+    fname = f"{command_name}_{uuid}"
+    _memory_cache[fname] = dataclasses.replace(cache, data=dict(cache.data))
     error_message_template = "%s list models failed to save cache: %s."
     try:
         save_to_cache(cache, fname)
-        logger.debug(
-            "%s list models: save result to cache `%s`", controller.controller_uuid, str(fname)
-        )
+        logger.debug("%s list models: save result to cache `%s`", uuid, str(fname))
     except JujuSpellError as error:
-        logger.warning(error_message_template, controller.controller_uuid, str(error))
+        logger.warning(error_message_template, uuid, str(error))
     return cache
 
 
 def load_cache_data(fname: str, logger: Logger, uuid: str) -> Union[None, Cache]:
     """Gracefully load cache data from default cache directory."""
-    cache = None
-    error_message_template = "%s list models failed to load cache: %s."
-    try:
-        cache = load_from_cache(fname)
-        cache.data["refresh"] = False
-        logger.debug("%s list models: load result from cache `%s`", uuid, str(fname))
-    except JujuSpellError as error:
-        logger.warning(error_message_template, uuid, str(error))
-    return cache
+    cache = _memory_cache.get(fname)
+    if cache is not None:
+        logger.debug("%s list models: load result from memory cache `%s`", uuid, str(fname))
+    else:
+        error_message_template = "%s list models failed to load cache: %s."
+        try:
+            cache = _memory_cache[fname] = load_from_cache(fname)
+            logger.debug("%s list models: load result from cache `%s`", uuid, str(fname))
+        except JujuSpellError as error:
+            logger.warning(error_message_template, uuid, str(error))
+            return None
+
+    # the cache is shared within the process, so it's copied before it's changed
+    return dataclasses.replace(cache, data={**cache.data, "refresh": False})
@@ -1,10 +1,13 @@
 """Command to check connection to controllers."""
-from typing import Any
+from __future__ import annotations
 
-from juju.controller import Controller
+from typing import TYPE_CHECKING, Any
 
 from juju_spell.commands.base import BaseJujuCommand
 
+if TYPE_CHECKING:
+    from juju.controller import Controller
+
 
 class PingCommand(BaseJujuCommand):
     """Ping command."""
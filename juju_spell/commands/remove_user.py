@@ -14,15 +14,19 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Command to remove users."""
-from typing import Any, List, Optional, Union
+from __future__ import annotations
 
-from juju.controller import Controller
+import asyncio
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 
 from juju_spell.commands.base import BaseJujuCommand, Result
 from juju_spell.commands.enable_user import DisableUserCommand
 from juju_spell.commands.revoke import RevokeCommand, RevokeModelCommand
 from juju_spell.exceptions import JujuSpellError
 
+if TYPE_CHECKING:
+    from juju.controller import Controller
+
 __all__ = ["RemoveUserCommand"]
 
 
@@ -47,49 +51,58 @@ class RemoveUserCommand(BaseJujuCommand):
         **kwargs: Any,
     ) -> Union[bool, Result]:
         """Execute."""
-        # Revoke model
-        revoke_model_cmd = RevokeModelCommand()
-        async for _, model in self.get_filtered_models(
+        controller_uuid = controller.controller_uuid
+        model_uuids = await self.get_filtered_model_uuids(
             controller=controller,
             models=models,
             model_mappings=kwargs["controller_config"].model_mapping,
-        ):
-            revoke_model_result = await revoke_model_cmd.run(
-                controller=controller, user=user, model_uuid=model.uuid, acl="read"
+        )
+
+        # Revoke model, revoking access to each model is independent, so they run concurrently
+        revoke_model_cmd = RevokeModelCommand()
+        revoke_model_results = await asyncio.gather(
+            *(
+                revoke_model_cmd.run(
+                    controller=controller, user=user, model_uuid=model_uuid, acl="read"
+                )
+                for model_uuid in model_uuids
             )
+        )
+        for model_uuid, revoke_model_result in zip(model_uuids, revoke_model_results):
             if not revoke_model_result.success:
                 self.logger.warning(
                     "%s model %s revoke model user %s fail. %s %s",
-                    controller.controller_uuid,
-                    model.uuid,
+                    controller_uuid,
+                    model_uuid,
                     user,
                     revoke_model_result.output,
                     revoke_model_result.error,
                 )
 
-        # Revoke
+        # Revoke and disable
         revoke_cmd = RevokeCommand()
-        revoke_result = await revoke_cmd.run(controller=controller, user=user, acl="login")
+        disable_cmd = DisableUserCommand()
+        revoke_result, disable_result = await asyncio.gather(
+            revoke_cmd.run(controller=controller, user=user, acl="login"),
+            disable_cmd.run(controller=controller, user=user),
+        )
         if not revoke_result.success:
             self.logger.warning(
                 "%s revoke user %s fail %s %s",
-                controller.controller_uuid,
+                controller_uuid,
                 user,
                 revoke_result.output,
                 revoke_result.error,
             )
 
-        # Disable
-        disable_cmd = DisableUserCommand()
-        disable_result = await disable_cmd.run(controller=controller, user=user)
         if not disable_result.success:
             self.logger.warning(
                 "%s disable user %s fail %s %s",
-                controller.controller_uuid,
+                controller_uuid,
                 user,
-                revoke_result.output,
-                revoke_result.error,
+                disable_result.output,
+                disable_result.error,
             )
 
-        self.logger.info("%s user `%s` was successfully removed", controller.controller_uuid, user)
+        self.logger.info("%s user `%s` was successfully removed", controller_uuid, user)
         return True
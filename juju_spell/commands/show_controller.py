@@ -1,11 +1,14 @@
 """Command to show controllers information."""
-from typing import Any
+from __future__ import annotations
 
-from juju.client._definitions import ControllerAPIInfoResults
-from juju.controller import Controller
+from typing import TYPE_CHECKING, Any
 
 from juju_spell.commands.base import BaseJujuCommand
 
+if TYPE_CHECKING:
+    from juju.client._definitions import ControllerAPIInfoResults
+    from juju.controller import Controller
+
 
 class ShowControllerCommand(BaseJujuCommand):
     """Command to show a controller."""
@@ -1,11 +1,14 @@
 """Command to get status of models."""
-from typing import Any, Dict, List, Optional
+from __future__ import annotations
 
-from juju.client._definitions import FullStatus
-from juju.controller import Controller
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from juju_spell.commands.base import BaseJujuCommand
 
+if TYPE_CHECKING:
+    from juju.client._definitions import FullStatus
+    from juju.controller import Controller
+
 
 class StatusCommand(BaseJujuCommand):
     """Command to show status for models."""
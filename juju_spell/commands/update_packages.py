@@ -1,14 +1,18 @@
 """Command to update packages on units."""
-import copy
+from __future__ import annotations
+
+import asyncio
 import dataclasses
 import re
-from typing import Any, Dict, List, Optional, Tuple
-
-from juju.action import Action
-from juju.controller import Controller
-from juju.model import Model
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from juju_spell.commands.base import BaseJujuCommand, Result
+from juju_spell.settings import DEFAULT_PARALLEL_UNITS
+
+if TYPE_CHECKING:
+    from juju.action import Action
+    from juju.controller import Controller
+    from juju.model import Model
 
 __all__ = ["UpdatePackagesCommand"]
 
@@ -20,8 +24,16 @@ UPDATE_TEMPLATE = (
 
 TIMEOUT_TO_RUN_COMMAND_SECONDS = 600
 
+# pylint: disable-next=line-too-long
+# Inst libdrm2 [2.4.110-1ubuntu1] (2.4.113-2~ubuntu0.22.04.1 Ubuntu:22.04/jammy-updates [amd64]) # noqa
+INST_LINE_PATTERN = r"Inst (\S+) \[([^\]]+)\] \(([^\s)]+)"
+# Unpacking software-properties-common (0.99.9.11) over (0.99.9.10)
+UNPACKING_LINE_PATTERN = r"Unpacking (\S+) \(([^)]+)\) over \(([^)]+)\)"
+# both line types are matched in a single pass over the apt output
+APT_LINE_REGEX = re.compile(rf"^(?:{INST_LINE_PATTERN}|{UNPACKING_LINE_PATTERN})", re.MULTILINE)
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(frozen=True)
 class PackageUpdateResult:
     """Package update result."""
 
@@ -39,6 +51,7 @@ class UnitUpdateResult:
     packages: List[PackageUpdateResult]
     raw_output: Optional[str] = ""
     success: bool = False
+    error: Optional[str] = None
 
 
 @dataclasses.dataclass
@@ -86,6 +99,7 @@ class UpdatePackagesCommand(BaseJujuCommand):
             model_mapping=kwargs["controller_config"].model_mapping,
             updates=kwargs["patch"],
             dry_run=False,
+            parallel_units=kwargs.get("parallel_units", DEFAULT_PARALLEL_UNITS),
         )
 
     async def dry_run(
@@ -101,6 +115,7 @@ class UpdatePackagesCommand(BaseJujuCommand):
             model_mapping=kwargs["controller_config"].model_mapping,
             updates=kwargs["patch"],
             dry_run=True,
+            parallel_units=kwargs.get("parallel_units", DEFAULT_PARALLEL_UNITS),
         )
 
     # pylint: disable-next=too-many-arguments
@@ -111,6 +126,8 @@ class UpdatePackagesCommand(BaseJujuCommand):
         dry_run: bool,
         model_mapping: Dict[str, List[str]],
         updates: Updates,
+        *,
+        parallel_units: int = DEFAULT_PARALLEL_UNITS,
     ) -> Optional[Result]:
         """Run the updates or dry-run."""
         output = {}
@@ -119,73 +136,78 @@ class UpdatePackagesCommand(BaseJujuCommand):
             model_mappings=model_mapping,
             models=models,
         ):
-            model_result: Updates = copy.deepcopy(updates)
+            # only results are filled per model, the rest of applications is shared read-only
+            model_result = Updates(
+                applications=[dataclasses.replace(app, results=[]) for app in updates.applications]
+            )
             self.set_apps_to_update(model, model_result, dry_run=dry_run)
-            await self.run_updates_on_model(model, model_result)
+            await self.run_updates_on_model(model, model_result, parallel_units)
 
             output[name] = model_result
         return Result(output=output, success=True, error=None)
 
-    async def run_updates_on_model(self, model: Model, updates: Updates) -> None:
+    async def run_updates_on_model(
+        self, model: Model, updates: Updates, parallel_units: int = DEFAULT_PARALLEL_UNITS
+    ) -> None:
         """Run updates on model.
 
         Runs the command on unit and parses the result and assigns it to each unit.
+        At most `parallel_units` units are updated at the same time. A failure on one
+        unit does not stop the others, instead it's recorded as unsuccessful update.
         """
-        for app in updates.applications:
-            for result in app.results:
-                for unit in result.units:
+        semaphore = asyncio.Semaphore(parallel_units)
+
+        async def _update_unit(app: Application, unit: UnitUpdateResult) -> None:
+            async with semaphore:
+                self.logger.info(
+                    "updating model:%s unit:%s with command:%s",
+                    model.info.name,
+                    unit.unit,
+                    unit.command,
+                )
+                try:
                     juju_unit = model.units[unit.unit]
-                    self.logger.info(
-                        "updating model:%s unit:%s with command:%s",
-                        model.info.name,
-                        unit.unit,
-                        unit.command,
-                    )
                     action: Action = await juju_unit.run(
                         command=unit.command, timeout=TIMEOUT_TO_RUN_COMMAND_SECONDS
                     )
                     stdout = action.data["results"]["Stdout"]
-                    updated_packages = self.parse_result(stdout)
-                    unit.packages = updated_packages
-                    self.set_success_flags(unit, app.packages_to_update)
-                    unit.raw_output = stdout
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    self.logger.error(
+                        "model:%s unit:%s update failed: %s", model.info.name, unit.unit, error
+                    )
+                    unit.success = False
+                    unit.error = str(error)
+                    return
+
+                updated_packages = self.parse_result(stdout)
+                unit.packages = updated_packages
+                self.set_success_flags(unit, app.packages_to_update)
+                unit.raw_output = stdout
+
+        await asyncio.gather(
+            *(
+                _update_unit(app, unit)
+                for app in updates.applications
+                for result in app.results
+                for unit in result.units
+            )
+        )
 
     def parse_result(self, result: str) -> List[PackageUpdateResult]:
         """Parse result.
 
         Parses the result and creates PackageUpdateResult structure.
         """
-        lines = result.splitlines()
         packages: List[PackageUpdateResult] = []
-        for line in lines:
-            from_version, name, to_version = self.parse_line(line)
-            if from_version != "" and to_version != "" and name != "":
-                packages.append(
-                    PackageUpdateResult(
-                        package=name, from_version=from_version, to_version=to_version
-                    )
-                )
+        for match in APT_LINE_REGEX.findall(result):
+            inst_name, inst_from, inst_to, name, to_version, from_version = match
+            if inst_name:
+                packages.append(PackageUpdateResult(inst_name, inst_from, inst_to))
+            else:
+                packages.append(PackageUpdateResult(name, from_version, to_version))
 
         return packages
 
-    def parse_line(self, line: str) -> Tuple[str, str, str]:
-        """Parse the line and return (from_version, name, to_version) tuple."""
-        # pylint: disable-next=line-too-long
-        # Inst libdrm2 [2.4.110-1ubuntu1] (2.4.113-2~ubuntu0.22.04.1 Ubuntu:22.04/jammy-updates [amd64]) # noqa
-        to_version = ""
-        from_version = ""
-        name = ""
-        if line.startswith("Inst "):
-            _, name, from_version, to_version, *_ = line.split(" ")
-
-        # Unpacking software-properties-common (0.99.9.11) over (0.99.9.10)
-        elif line.startswith("Unpacking"):
-            _, name, to_version, _, from_version, *_ = line.split(" ")
-        to_version = to_version.strip("()[]")
-        from_version = from_version.strip("()[]")
-        name = name.strip(" ")
-        return from_version, name, to_version
-
     def get_update_command(self, app: Application, dry_run: bool) -> str:
         """Generate command according to flags."""
         template = UPDATE_TEMPLATE + ("--dry-run" if dry_run else "")
@@ -202,14 +224,17 @@ class UpdatePackagesCommand(BaseJujuCommand):
         Finds the matching applications and set the units of these applications as a
         List[UpdateResult] to application.
         """
-        self.logger.info("Finding applications to update on model:%s", model.info.name)
+        model_name = model.info.name
+        applications = list(model.applications.items())  # property builds a new dict
+        self.logger.info("Finding applications to update on model:%s", model_name)
         for update in updates.applications:
             command = self.get_update_command(app=update, dry_run=dry_run)
-            for app, app_status in model.applications.items():
-                if re.match(update.name_expr, app):
+            name_expr = re.compile(update.name_expr)
+            for app, app_status in applications:
+                if name_expr.match(app):
                     self.logger.info(
                         "model:%s application:%s units:%s will be updated",
-                        model.info.name,
+                        model_name,
                         app,
                         [u.name for u in app_status.units],
                     )
@@ -221,8 +246,6 @@ class UpdatePackagesCommand(BaseJujuCommand):
 
     def set_success_flags(self, unit: UnitUpdateResult, expected: List[PackageToUpdate]) -> None:
         """Set success flag for each unit."""
-        expected_set = set((e.version, e.package) for e in expected)
-        real_set = set((p.to_version, p.package) for p in unit.packages)
-
-        res = expected_set.intersection(real_set)
-        unit.success = res == expected_set
+        expected_set = {(e.version, e.package) for e in expected}
+        real_set = {(p.to_version, p.package) for p in unit.packages}
+        unit.success = expected_set.issubset(real_set)
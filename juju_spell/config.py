@@ -4,7 +4,7 @@ import logging
 import re
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Pattern, Union
 
 import confuse
 from confuse import ConfigError, RootView
@@ -38,7 +38,7 @@ API_ENDPOINT_REGEX = (
     r"(:\d+)?$"  # port
 )
 UUID_REGEX = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
-CA_CERT_REGEX = r"^(-*)BEGIN CERTIFICATE(-*)\n((.|\n)*)\n(-*)END CERTIFICATE(-*)$"
+CA_CERT_REGEX = r"^(-*)BEGIN CERTIFICATE(-*)\n([\s\S]*)\n(-*)END CERTIFICATE(-*)$"
 SUBNET_REGEX = r"^([0-9]{1,3}\.){3}[0-9]{1,3}($|/(8|9|1[0-9]|2[0-9]|3[0-2]))$"
 DESTINATION_REGEX = (
     r"^([A-Za-z]*@)?"  # Optional[user]
@@ -62,20 +62,20 @@ class Regex(confuse.Template):
 
     def __init__(
         self,
-        pattern: str,
+        pattern: Union[str, Pattern[str]],
         message: str,
         return_type: Any,
         default: Optional[str] = None,
     ):
         """Initialize the Regex object."""
         super().__init__(default=default)
-        self._regex = re.compile(pattern)
+        self._regex = re.compile(pattern)  # already compiled pattern is returned as it is
         self._message = message
         self._return_type = return_type
 
     def convert(self, value: Any, view: confuse.ConfigView) -> Any:
         """Check that the value is valid url."""
-        if not isinstance(value, self._return_type) or re.match(self._regex, value) is None:
+        if not isinstance(value, self._return_type) or self._regex.match(value) is None:
             self.fail(self._message, view, True)
 
         return self._return_type(value)
@@ -84,7 +84,9 @@ class Regex(confuse.Template):
 class String(Regex):
     """A template used to validate string with regex and provide custom error."""
 
-    def __init__(self, pattern: str, message: str, default: Optional[str] = None):
+    def __init__(
+        self, pattern: Union[str, Pattern[str]], message: str, default: Optional[str] = None
+    ):
         """Initialize the String object."""
         super().__init__(pattern, message, str, default)
 
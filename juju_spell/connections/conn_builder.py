@@ -1,10 +1,11 @@
 """Module to build connection to controller."""
+from __future__ import annotations
+
 import logging
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 from uuid import UUID
 
 import tenacity
-from juju import juju
 from juju.errors import JujuConnectionError
 from tenacity import RetryCallState, RetryError, Retrying
 from tenacity.retry import RetryBaseT
@@ -14,6 +15,9 @@ from tenacity.wait import WaitBaseT
 from juju_spell.config import RetryPolicy
 from juju_spell.settings import DEFAULT_CONNECTION_WAIT, DEFAULT_MAX_FRAME_SIZE
 
+if TYPE_CHECKING:
+    from juju import juju
+
 logger = logging.getLogger(__name__)
 
 
@@ -1,14 +1,20 @@
 """Module for managing connection to controllers."""
+from __future__ import annotations
+
+import asyncio
+import atexit
 import dataclasses
 import logging
-from typing import Dict, Union
-
-from juju import juju
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from juju_spell.config import Controller
 from juju_spell.connections.conn_builder import build_controller_conn
 from juju_spell.connections.network import BaseConnection, get_connection
-from juju_spell.settings import DEFAULT_MAX_FRAME_SIZE
+from juju_spell.settings import DEFAULT_CONNECTION_TTL, DEFAULT_MAX_FRAME_SIZE
+
+if TYPE_CHECKING:
+    from juju import juju
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +25,13 @@ class Connection:
 
     controller: juju.Controller
     connection_process: BaseConnection
+    last_used: float = dataclasses.field(default_factory=time.monotonic)
+    loop: Optional[asyncio.AbstractEventLoop] = None  # loop in which it was created
+
+    @property
+    def expired(self) -> bool:
+        """Check if connection was not used longer than DEFAULT_CONNECTION_TTL."""
+        return time.monotonic() - self.last_used > DEFAULT_CONNECTION_TTL
 
 
 def _get_wait_time(attempt: int, retry_backoff: Union[int, float]) -> float:
@@ -56,14 +69,25 @@ class ConnectManager:
             controller = await connect_manager.get_controller(controller_config)
             ...
         ```
+
+    Connections are kept open and reused by following commands in the same process
+    and event loop, until they are not used for DEFAULT_CONNECTION_TTL seconds. All
+    connections are closed at interpreter exit.
     """
 
-    _manager = None
-    _connections: Dict[str, Connection] = {}
+    _manager: Optional[ConnectManager] = None
+    _connections: Dict[str, Connection]
+    _pending: Dict[str, asyncio.Future[juju.Controller]]
+    _cleanup_registered: bool
 
-    def __new__(cls) -> "ConnectManager":
+    def __new__(cls) -> ConnectManager:
         if cls._manager is None:
-            cls._manager = super(ConnectManager, cls).__new__(cls)
+            manager = super(ConnectManager, cls).__new__(cls)
+            # the state is created with the singleton, not shared as mutable class attributes
+            manager._connections = {}
+            manager._pending = {}
+            manager._cleanup_registered = False
+            cls._manager = manager
 
         return cls._manager
 
@@ -72,36 +96,162 @@ class ConnectManager:
         """Return list of connections ."""
         return self._connections
 
+    async def _connect_once(
+        self, controller_config: Controller, sshuttle: bool = False
+    ) -> juju.Controller:
+        """Connect to controller, sharing an in-flight connection attempt.
+
+        Concurrent callers asking for the same controller while it's still connecting
+        will await the same connection instead of creating a new one.
+        """
+        pending = self._pending.get(controller_config.name)
+        if pending is not None:
+            logger.debug("%s waiting for pending connection", controller_config.uuid)
+        else:
+            pending = asyncio.ensure_future(self._connect_pending(controller_config, sshuttle))
+            if not pending.done():  # eager task could already finish
+                self._pending[controller_config.name] = pending
+
+        # cancellation of one caller must not cancel the connection for the others
+        return await asyncio.shield(pending)
+
+    async def _connect_pending(
+        self, controller_config: Controller, sshuttle: bool = False
+    ) -> juju.Controller:
+        """Connect to controller and drop it from pending connections when finished."""
+        try:
+            return await self._connect(controller_config, sshuttle)
+        finally:
+            self._pending.pop(controller_config.name, None)
+
+    def _register_cleanup(self) -> None:
+        """Register cleanup of all connections at interpreter exit."""
+        if self._cleanup_registered:
+            return
+
+        atexit.register(self._clean_at_exit)
+        self._cleanup_registered = True
+
+    def _clean_at_exit(self) -> None:
+        """Close all connections at interpreter exit.
+
+        Connections are closed in the loop in which they were created if it is still
+        usable, otherwise in a new loop.
+        """
+        connections = list(self.connections.values())
+        self.connections.clear()
+        loops = {connection.loop for connection in connections}
+        for loop in loops:
+            loop_connections = [c for c in connections if c.loop is loop]
+            try:
+                if loop is not None and not loop.is_closed() and not loop.is_running():
+                    loop.run_until_complete(self._close_all(loop_connections))
+                else:
+                    asyncio.run(self._close_all(loop_connections))
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                logger.error("connections were not closed at exit: %s", error)
+
+    @staticmethod
+    async def _close(connection: Connection) -> None:
+        """Close single connection."""
+        try:
+            await connection.controller.disconnect()  # disconnect controller
+        finally:
+            connection.connection_process.clean()  # clean connection process
+
+        logger.info("%s connection was closed", connection.controller.controller_uuid)
+
     async def _connect(
         self, controller_config: Controller, sshuttle: bool = False
     ) -> juju.Controller:
         """Prepare connection to Controller and return it."""
+        # juju is imported lazily, since it's slow to import and not needed for CLI help
+        # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+        from juju import juju
+
         logger.info("getting a new connection to controller %s", controller_config.name)
         controller = juju.Controller(max_frame_size=DEFAULT_MAX_FRAME_SIZE)
         controller_endpoint, connection_process = get_connection(controller_config, sshuttle)
-        connection_process.connect()
-        self.connections[controller_config.name] = Connection(controller, connection_process)
-        await build_controller_conn(
-            controller,
-            uuid=controller_config.uuid,
-            name=controller_config.name,
-            endpoint=controller_endpoint,
-            username=controller_config.user,
-            password=controller_config.password,
-            cacert=controller_config.ca_cert,
-            retry_policy=controller_config.retry_policy,
+        try:
+            await connection_process.connect()
+            await build_controller_conn(
+                controller,
+                uuid=controller_config.uuid,
+                name=controller_config.name,
+                endpoint=controller_endpoint,
+                username=controller_config.user,
+                password=controller_config.password,
+                cacert=controller_config.ca_cert,
+                retry_policy=controller_config.retry_policy,
+            )
+        except Exception:
+            connection_process.clean()  # e.g. terminate ssh tunnel and release its port
+            raise
+
+        # connection is registered only after successful login
+        old_connection = self.connections.pop(controller_config.name, None)
+        if old_connection is not None:
+            await self._close_all([old_connection])
+
+        self.connections[controller_config.name] = Connection(
+            controller, connection_process, loop=asyncio.get_running_loop()
         )
+        self._register_cleanup()
         logger.info("controller %s was connected", controller.controller_name)
         return controller
 
     async def clean(self) -> None:
         """Close all connections."""
-        for connection in self.connections.values():
-            await connection.controller.disconnect()  # disconnect controller
-            connection.connection_process.clean()  # clean connection process
-            logger.info("%s connection was closed", connection.controller.controller_uuid)
+        if not self.connections:
+            return
 
+        connections = list(self.connections.values())
         self.connections.clear()
+        await self._close_all(connections)
+
+    async def _close_all(self, connections: List[Connection]) -> None:
+        """Close connections, a failure to close one does not affect the others."""
+        # connections are independent, so they are closed concurrently
+        results = await asyncio.gather(
+            *(self._close(connection) for connection in connections), return_exceptions=True
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "%s connection was not closed properly: %s",
+                    connection.controller.controller_uuid,
+                    result,
+                )
+
+    async def _evict(self) -> None:
+        """Close expired connections and drop connections from other event loops.
+
+        Connection created in another loop can't be used or disconnected in this one,
+        so only its connection process is cleaned.
+        """
+        loop = asyncio.get_running_loop()
+        expired = []
+        for name, connection in list(self.connections.items()):
+            if connection.loop is not loop:
+                logger.info(
+                    "%s connection belongs to another event loop",
+                    connection.controller.controller_uuid,
+                )
+                del self.connections[name]
+                try:
+                    connection.connection_process.clean()
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    logger.error(
+                        "%s connection process was not cleaned: %s",
+                        connection.controller.controller_uuid,
+                        error,
+                    )
+            elif connection.expired:
+                logger.info("%s connection expired", connection.controller.controller_uuid)
+                del self.connections[name]
+                expired.append(connection)
+
+        await self._close_all(expired)
 
     async def get_controller(
         self,
@@ -114,12 +264,19 @@ class ConnectManager:
             controller_config, Controller
         ), "Not supported format of controller config"
 
+        if controller_config.name in self._pending and not reconnect:
+            return await self._connect_once(controller_config, sshuttle)
+
+        await self._evict()
         connection = self.connections.get(controller_config.name)
         controller = None
         if connection and connection.controller.is_connected() and not reconnect:
             logger.info("%s using controller from cache", connection.controller.controller_uuid)
+            connection.last_used = time.monotonic()
             controller = connection.controller
-        elif connection and reconnect:
-            await connection.controller.disconnect()
+        elif connection:
+            # connection is replaced, so its connection process is cleaned as well
+            del self.connections[controller_config.name]
+            await self._close_all([connection])
 
-        return controller or await self._connect(controller_config, sshuttle)
+        return controller or await self._connect_once(controller_config, sshuttle)
@@ -1,41 +1,62 @@
 """Module handling connection to remote cloud."""
 import abc
+import asyncio
+import itertools
 import logging
 import random
 import socket
-import subprocess
-from typing import List, Optional, Tuple
+import threading
+from asyncio.subprocess import Process
+from typing import List, Optional, Set, Tuple
 
 from juju_spell.config import Controller
 
 logger = logging.getLogger(__name__)
 
+# ports handed out by get_free_tcp_port, ssh binds them only after it is started
+_reserved_ports: Set[int] = set()
+_reserved_ports_lock = threading.Lock()
+
 
 def _is_port_free(port: int) -> bool:
-    """Check if port is free to use."""
-    tcp = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    result = tcp.connect_ex(("localhost", port))
-    tcp.close()
-    return result != 0
+    """Check if port is free to use.
+
+    The port is free if it can be bound, which does not need any connection attempt.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as tcp:
+        try:
+            tcp.bind(("localhost", port))
+        except OSError:
+            return False
+
+    return True
 
 
 def get_free_tcp_port(port_range: range) -> int:
     """Get free TCP port from range.
 
     This function will return free port on local system. This port will be used to
-    port-forward remote controller to localhost:<port>.
+    port-forward remote controller to localhost:<port>. The port stays reserved, so
+    it's not returned again until it's released with release_tcp_port.
     """
-    list_of_ports = list(port_range)
-    random.shuffle(list_of_ports)  # randomly shuffle list of ports
-
-    for port in list_of_ports:
-        if _is_port_free(port):
-            logger.debug("free port %d was found", port)
-            return port
+    # start from random position in range and wrap around, so the range is not copied
+    start = random.randrange(len(port_range)) if port_range else 0
+    with _reserved_ports_lock:
+        for port in itertools.chain(port_range[start:], port_range[:start]):
+            if port not in _reserved_ports and _is_port_free(port):
+                _reserved_ports.add(port)
+                logger.debug("free port %d was found", port)
+                return port
 
     raise ValueError(f"Could not find a free port in range {port_range}")
 
 
+def release_tcp_port(port: int) -> None:
+    """Release port reserved by get_free_tcp_port."""
+    with _reserved_ports_lock:
+        _reserved_ports.discard(port)
+
+
 class BaseConnection(metaclass=abc.ABCMeta):
     """Base connection."""
 
@@ -45,7 +66,7 @@ class BaseConnection(metaclass=abc.ABCMeta):
         """Return True if connection is alive."""
 
     @abc.abstractmethod
-    def connect(self) -> None:  # pragma: no cover
+    async def connect(self) -> None:  # pragma: no cover
         """Create connection.
 
         This function is responsible for any port-forwarding, sshuttle tunnelling, etc.
@@ -67,7 +88,7 @@ class EmptyConnection(BaseConnection):
     def is_connected(self) -> bool:
         return self._connected
 
-    def connect(self) -> None:
+    async def connect(self) -> None:
         self._connected = True
 
     def clean(self) -> None:
@@ -79,7 +100,7 @@ class BaseSubprocessConnection(BaseConnection):
 
     def __init__(self) -> None:
         """Define empty process."""
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[Process] = None
 
     @property
     def is_connected(self) -> bool:
@@ -89,13 +110,16 @@ class BaseSubprocessConnection(BaseConnection):
 
         return True
 
-    def connect(self) -> None:
+    async def connect(self) -> None:
         raise NotImplementedError
 
     def clean(self) -> None:
         """Terminate connection subprocess."""
-        if self.process is not None:
-            self.process.terminate()
+        if self.process is not None and self.process.returncode is None:
+            try:
+                self.process.terminate()
+            except ProcessLookupError:  # process exited, but it was not awaited yet
+                logger.debug("process %d already exited", self.process.pid)
 
 
 class SshPortForwardSubprocess(BaseSubprocessConnection):
@@ -116,7 +140,7 @@ class SshPortForwardSubprocess(BaseSubprocessConnection):
         connection = SshPortForwardSubprocess(
             "localhost:17071", "10.1.1.99:17070", "gandalf@customer", ["bastion"]
         )
-        connection.connect()
+        await connection.connect()
         ...
         connection.clean()
         ```
@@ -141,7 +165,7 @@ class SshPortForwardSubprocess(BaseSubprocessConnection):
         self.destination = destination
         self.jumps = jumps
 
-    def connect(self) -> None:
+    async def connect(self) -> None:
         """Create ssh tunnel."""
         logger.info(
             "port forwarding %s to %s via %s",
@@ -157,11 +181,23 @@ class SshPortForwardSubprocess(BaseSubprocessConnection):
             f"{self.local_target}:{self.remote_target}",
         ]
         if self.jumps:
-            cmd.append(" ".join(f"-J {jump}" for jump in self.jumps))
+            # ssh accepts a single -J option with comma separated jump hops
+            cmd.extend(["-J", ",".join(self.jumps)])
 
         logger.debug("cmd `%s` will be executed", cmd)
-        # pylint: disable=R1732
-        self.process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # output is not read, so it's discarded instead of filling up pipe buffers
+        self.process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+        )
+
+    def clean(self) -> None:
+        """Terminate ssh tunnel and release its local port."""
+        try:
+            super().clean()
+        finally:
+            port = self.local_target.rsplit(":", 1)[-1]
+            if port.isdigit():
+                release_tcp_port(int(port))
 
 
 class SshuttleSubprocess(BaseSubprocessConnection):
@@ -176,7 +212,7 @@ class SshuttleSubprocess(BaseSubprocessConnection):
         connection = SshuttleSubprocess(
             ["10.1.1.0/24"], "gandalf@customer", ["bastion"]
         )
-        connection.connect()
+        await connection.connect()
         ...
         connection.clean()
         ```
@@ -198,17 +234,18 @@ class SshuttleSubprocess(BaseSubprocessConnection):
         self.destination = destination
         self.jumps = jumps
 
-    def connect(self) -> None:
+    async def connect(self) -> None:
         """Create sshuttle tunnel."""
         logger.info("sshuttle %s subnets via %s", self.subnets, self.destination)
         cmd = ["sshuttle", *self.subnets, "-r", self.destination]
         if self.jumps:
-            jumps_option = " ".join(f"-J {jump}" for jump in self.jumps)
-            cmd.append(f"-e 'ssh {jumps_option}'")
+            cmd.extend(["-e", f"ssh -J {','.join(self.jumps)}"])
 
         logger.debug("cmd `%s` will be executed", cmd)
-        # pylint: disable=R1732
-        self.process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # output is not read, so it's discarded instead of filling up pipe buffers
+        self.process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+        )
 
 
 def get_connection(
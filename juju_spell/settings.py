@@ -33,7 +33,12 @@ DEFAULT_PORT_RANGE = range(17071, 17170)
 DEFAULT_RETRY_BACKOFF = 1.5  # seconds
 DEFAULT_CONNECTION_TIMEOUT = 60  # seconds
 DEFAULT_CONNECTION_WAIT = 1  # seconds
-DEFAULT_MAX_FRAME_SIZE = 6**24
+DEFAULT_CONNECTION_TTL = 300  # seconds
+DEFAULT_MODELS_CACHE_TTL = 30  # seconds
+DEFAULT_MAX_FRAME_SIZE = 6 * 2**24  # bytes (96 MiB), big models have large status frames
+DEFAULT_PARALLEL_LIMIT = 10  # controllers processed at the same time
+DEFAULT_BATCH_SIZE = 5  # controllers in one batch
+DEFAULT_PARALLEL_UNITS = 1  # units updated at the same time in one model
 
 
 CROSS_FINGERS = """
@@ -16,9 +16,9 @@
 
 """Utilities for JujuSpell."""
 import dataclasses
+import json
 import logging
 import secrets
-from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Union
 
@@ -27,8 +27,18 @@ import yaml
 from juju_spell.exceptions import JujuSpellError
 from juju_spell.settings import DEFAULT_CACHE_DIR
 
+# use the libyaml based loader and dumper if available, which are much faster than the
+# pure Python ones
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 logger = logging.getLogger(__name__)
 
+_BOOL_VALUES = {
+    **dict.fromkeys(("y", "yes", "t", "true", "on", "1"), True),
+    **dict.fromkeys(("n", "no", "f", "false", "off", "0"), False),
+}
+
 
 @dataclasses.dataclass(frozen=True)
 class CacheContext:
@@ -45,8 +55,16 @@ class Cache(CacheContext):
 
     @property
     def context(self) -> Dict[str, Any]:
-        """Return the cache context as a dictionary."""
-        return dataclasses.asdict(self)
+        """Return the cache context as a dictionary.
+
+        The data are not copied, unlike with dataclasses.asdict.
+        """
+        return {
+            "uuid": self.uuid,
+            "name": self.name,
+            "data": self.data,
+            "timestamp": self.timestamp,
+        }
 
     def add_policy(self) -> None:
         """Add more policy to the default policy."""
@@ -60,14 +78,11 @@ def strtobool(value: str) -> bool:
         or a False value of 'n', 'no', 'f', 'false', 'off', and '0'.
     :raises ValueError: if `value` is not a valid boolean value.
     """
-    parsed_value = value.lower()
-
-    if parsed_value in ("y", "yes", "t", "true", "on", "1"):
-        return True
-    if parsed_value in ("n", "no", "f", "false", "off", "0"):
-        return False
+    result = _BOOL_VALUES.get(value.lower())
+    if result is None:
+        raise ValueError(f"Invalid boolean value of {value!r}")
 
-    raise ValueError(f"Invalid boolean value of {value!r}")
+    return result
 
 
 def humanize_list(
@@ -84,13 +99,16 @@ def humanize_list(
     :param item_format: format string to use per item.
     :param sort: if true, sort the list.
     """
-    if not items:
-        return ""
+    if item_format == "{!r}":
+        quoted_items = list(map(repr, items))  # same result without parsing the format
+    else:
+        quoted_items = [item_format.format(item) for item in items]
 
-    quoted_items = [item_format.format(item) for item in items]
+    if not quoted_items:
+        return ""
 
     if sort:
-        quoted_items = sorted(quoted_items)
+        quoted_items.sort()
 
     if len(quoted_items) == 1:
         return quoted_items[0]
@@ -119,10 +137,14 @@ def merge_list_of_dict_by_key(key: str, lists: List[List[Dict]]) -> List:
             {"index": 4, "v": "b"},
         ]
     """
-    new_dict: Dict = defaultdict(dict)
+    new_dict: Dict[Any, Dict] = {}
     for _list in lists:
         for elem in _list:
-            new_dict[elem[key]].update(elem)
+            merged = new_dict.get(elem[key])
+            if merged is None:
+                new_dict[elem[key]] = dict(elem)
+            else:
+                merged.update(elem)
     return list(new_dict.values())
 
 
@@ -134,13 +156,18 @@ def random_password(length: int = 30) -> str:
 def load_yaml_file(path: Path) -> Any:
     """Load yaml file.
 
+    JSON files, which are also valid YAML, are parsed with the faster json module.
+
     raises: IsADirectoryError if path is directory
     raises: FileNotFoundError -> JujuSpellError if fies does not exist
     raises: PermissionError -> JujuSpellError if user has no permission to path
     """
     try:
-        with open(path, "r", encoding="UTF-8") as file:
-            source = yaml.safe_load(file)
+        with open(path, "rb") as file:  # parsers decode UTF-8 bytes themselves
+            if Path(path).suffix == ".json":
+                source = json.load(file)
+            else:
+                source = yaml.load(file, Loader=YamlLoader)
             logger.info("load yaml file from %s path", path)
             return source
     except FileNotFoundError as error:
@@ -151,12 +178,11 @@ def load_yaml_file(path: Path) -> Any:
 
 def save_to_cache(cache: Cache, name: Union[str, Path]) -> None:
     """Save data to the default cache directory named by `name`."""
-    if not DEFAULT_CACHE_DIR.exists():
-        DEFAULT_CACHE_DIR.mkdir()
+    DEFAULT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
     fname = DEFAULT_CACHE_DIR / name
     try:
-        with open(fname, "w", encoding="UTF-8") as file:
-            data = yaml.safe_dump(cache.context)
+        with open(fname, "wb") as file:
+            data = yaml.dump(cache.context, Dumper=YamlDumper, encoding="utf-8")
             logger.info("save cache file to %s", str(fname))
             file.write(data)
     except PermissionError as error:
@@ -169,8 +195,8 @@ def load_from_cache(name: Union[str, Path]) -> Cache:
     """Load data from the default cache directory named by `name`."""
     fname = DEFAULT_CACHE_DIR / name
     try:
-        with open(fname, "r", encoding="UTF-8") as file:
-            data = yaml.safe_load(file)
+        with open(fname, "rb") as file:
+            data = yaml.load(file, Loader=YamlLoader)
             logger.info("load cache file from %s", str(fname))
             return Cache(**data)
     except FileNotFoundError as error:
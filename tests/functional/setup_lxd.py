@@ -16,8 +16,11 @@
 """JujuSpell configuration for functional tests."""
 import json
 import os
+import shlex
 import subprocess
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from time import sleep
 from typing import Any, Dict, List, Tuple, Union
@@ -41,7 +44,7 @@ Host *
 CONTROLLER_API_PORT = 17007
 NUMBER_OF_CONTROLLERS = 2
 STOPPED_CONTAINER_CODE = 102
-WAIT_TIMEOUT = 1
+WAIT_TIMEOUT = 2  # maximum seconds between attempts
 WAIT_COUNT = 10
 
 
@@ -49,8 +52,12 @@ class ExecuteError(Exception):
     ...
 
 
+@lru_cache(maxsize=None)
 def get_controller(name: str) -> Dict[str, Any]:
-    """Get information about controller."""
+    """Get information about controller.
+
+    The output is cached, so the returned dictionary should not be modified.
+    """
     output = subprocess.check_output(
         ["juju", "show-controller", "--show-password", "--format", "json", name]
     ).decode()
@@ -78,9 +85,12 @@ def lxd_execute(container: Instance, cmd: List[str], root: bool = False) -> _Ins
 
 
 def is_alive(container: Instance) -> bool:
-    """Check if container is alive."""
+    """Check if container is alive and snapd is seeded."""
     try:
-        lxd_execute(container, ["sudo", "snap", "refresh"])
+        if container.state().status != "Running":
+            return False
+
+        lxd_execute(container, ["sudo", "snap", "wait", "system", "seed.loaded"])
         return True
     except (NotFound, ExecuteError):
         return False
@@ -88,12 +98,14 @@ def is_alive(container: Instance) -> bool:
 
 def wait_for_container(container: Instance) -> None:
     """Wait for container to become alive."""
-    for _ in range(WAIT_COUNT):
-        sleep(WAIT_TIMEOUT)
+    for i in range(WAIT_COUNT):
         if is_alive(container):
-            break
+            print(f"LXD: container {container.name} is ready")
+            return
+
+        sleep(min(WAIT_TIMEOUT, 0.1 * 2**i))  # exponential backoff
 
-    print(f"LXD: container {container.name} is ready")
+    print(f"LXD: container {container.name} is not ready after {WAIT_COUNT} attempts")
 
 
 def try_unregister_controller(name: str) -> None:
@@ -138,17 +150,22 @@ def create_client_instance(
     client = create_container(session_uuid, "client", series)
     wait_for_container(client)
 
-    lxd_execute(client, ["sudo", "ufw", "enable"])
-    # drop direct connection to any controller, e.g. <ip>:CONTROLLER_API_PORT
-    lxd_execute(client, ["sudo", "ufw", "deny", "out", str(CONTROLLER_API_PORT)])
-    lxd_execute(client, ["ssh-keygen", "-q", "-f", "/home/ubuntu/.ssh/id_rsa", "-N", ""])
+    # run the preparation as one script to avoid a LXD exec round-trip per command
+    script = [
+        ["sudo", "ufw", "enable"],
+        # drop direct connection to any controller, e.g. <ip>:CONTROLLER_API_PORT
+        ["sudo", "ufw", "deny", "out", str(CONTROLLER_API_PORT)],
+        ["ssh-keygen", "-q", "-f", "/home/ubuntu/.ssh/id_rsa", "-N", ""],
+        # NOTE (rgildein): Right now JujuSpell is not creating `.local/share/juju-spell`
+        # directory, so we need to create it
+        ["mkdir", "-p", str(DEFAULT_DIRECTORY)],
+    ]
+    lxd_execute(client, ["sh", "-c", " && ".join(shlex.join(cmd) for cmd in script)])
     with open(snap_path, "rb") as snap:
-        client.files.put("/home/ubuntu/juju-spell.snap", snap.read(), uid=1000, gid=1000)
+        # file object is streamed by the HTTP client, so the snap is not read into memory
+        client.files.put("/home/ubuntu/juju-spell.snap", snap, uid=1000, gid=1000)
 
     lxd_execute(client, ["sudo", "snap", "install", "./juju-spell.snap", "--devmode"])
-    # NOTE (rgildein): Right now JujuSpell is not creating `.local/share/juju-spell`
-    # directory, so we need to create it
-    lxd_execute(client, ["mkdir", "-p", str(DEFAULT_DIRECTORY)])
 
     return client
 
@@ -172,8 +189,7 @@ def boostrap_controller(name: str, series: str, ssh_key: str) -> Instance:
             name,
         ]
     )
-    info = subprocess.check_output(["juju", "show-controller", name, "--format", "json"]).decode()
-    info = json.loads(info)
+    info = get_controller(name)
     instance_id = info[name]["controller-machines"]["0"]["instance-id"]
     client = Client()
     # ranme controller container so we can easily access it a remove it later
@@ -199,12 +215,13 @@ def setup_environment(
     # automaticaly, that's why we need to do this
     client.files.put("/home/ubuntu/.ssh/config", SSH_CONFIG, uid=1000)
 
-    # controllers
-    controllers = []
-    for i in range(NUMBER_OF_CONTROLLERS):
-        name = f"{CONTAINER_PREFIX}-controller-{i}-{session_uuid}"
-        controller = boostrap_controller(name, series, client_ssh_key)
-        controllers.append(controller.name)
+    # controllers, bootstrapping is independent and takes minutes, so run it in parallel
+    names = [
+        f"{CONTAINER_PREFIX}-controller-{i}-{session_uuid}" for i in range(NUMBER_OF_CONTROLLERS)
+    ]
+    with ThreadPoolExecutor(max_workers=NUMBER_OF_CONTROLLERS) as executor:
+        bootstrap = partial(boostrap_controller, series=series, ssh_key=client_ssh_key)
+        controllers = [controller.name for controller in executor.map(bootstrap, names)]
 
     # creates JujuSpell config
     config = {"controllers": []}
@@ -225,21 +242,30 @@ def setup_environment(
     return client.name, controllers
 
 
+def remove_instance(instance: Instance) -> None:
+    """Stop and delete instance and unregister controller running on it."""
+    # check if instance is not already stopped
+    if instance.status_code != STOPPED_CONTAINER_CODE:
+        instance.stop(wait=True)
+
+    instance.delete()
+    print(f"LXD: {instance.name} was removed")
+    try_unregister_controller(instance.name)
+
+
 def cleanup_environment(session_uuid: str, keep_env: bool = False):
     """Clean up LXD environment.
 
     Remove all instances with names starting with CONTAINER_PREFIX.
     """
     client = Client()
-    for instance in client.instances.all():
-        if str(session_uuid) in instance.name:
-            if keep_env:
-                # check if instance is not already stopped
-                if instance.status_code != STOPPED_CONTAINER_CODE:
-                    instance.stop(wait=True)
-
-                instance.delete()
-                print(f"LXD: {instance.name} was removed")
-                try_unregister_controller(instance.name)
-            else:
-                print(f"LXD: {instance.name} was kept for further testing")
+    instances = [
+        instance for instance in client.instances.all() if str(session_uuid) in instance.name
+    ]
+    if keep_env:
+        # instances are independent, so they are removed in parallel
+        with ThreadPoolExecutor(max_workers=len(instances) or 1) as executor:
+            list(executor.map(remove_instance, instances))
+    else:
+        for instance in instances:
+            print(f"LXD: {instance.name} was kept for further testing")
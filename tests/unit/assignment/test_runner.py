@@ -20,15 +20,17 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from juju_spell.assignment.runner import get_result, run_serial
+from juju_spell.assignment.runner import get_result, run_batch, run_parallel, run_serial
 from juju_spell.commands.base import Result
 
+CONTROLLER_CONFIG = MagicMock()  # get_result only passes it to the context
+
 
 @pytest.mark.parametrize(
     "controller_config, output, exp_result",
     [
         (
-            MagicMock(),
+            CONTROLLER_CONFIG,
             Result(True, "test-string-value", None),
             {
                 "context": mock.ANY,
@@ -38,7 +40,7 @@ from juju_spell.commands.base import Result
             },
         ),
         (
-            MagicMock(),
+            CONTROLLER_CONFIG,
             Result(False, "test-string-value", None),
             {
                 "context": mock.ANY,
@@ -48,12 +50,12 @@ from juju_spell.commands.base import Result
             },
         ),
         (
-            MagicMock(),
+            CONTROLLER_CONFIG,
             Result(True, 1234, None),
             {"context": mock.ANY, "success": True, "output": 1234, "error": None},
         ),
         (
-            MagicMock(),
+            CONTROLLER_CONFIG,
             Result(False, None, Exception("test")),
             {
                 "context": mock.ANY,
@@ -70,7 +72,6 @@ def test_get_result(controller_config, output, exp_result):
     assert result == exp_result
 
 
-@pytest.mark.asyncio
 @mock.patch("juju_spell.assignment.runner.get_controller", new_callable=mock.AsyncMock)
 @mock.patch("juju_spell.assignment.runner.get_result")
 @pytest.mark.parametrize(
@@ -129,12 +130,12 @@ async def test_run_serial(mock_get_result, mock_get_controller, steps, parsed_ar
     result = await run_serial(config, command, parsed_args)
 
     assert result == exp_result
+    assert "controller_config" not in vars(parsed_args)  # parsed_args was not modified
 
     for controller_config, pre_check, dry_run, run_output, exp_output in steps:
         mock_get_controller.assert_has_awaits([mock.call(controller_config)])
 
-        command_kwargs = vars(parsed_args)
-        command_kwargs["controller_config"] = controller_config
+        command_kwargs = {**vars(parsed_args), "controller_config": controller_config}
         command.pre_check.assert_has_awaits(
             [
                 mock.call(
@@ -167,3 +168,49 @@ async def test_run_serial(mock_get_result, mock_get_controller, steps, parsed_ar
             )
 
         mock_get_result.assert_has_calls([mock.call(controller_config, exp_output)])
+
+
+@pytest.mark.parametrize("run_func", [run_parallel, run_batch])
+@pytest.mark.parametrize("number_of_controllers", [0, 1, 7])
+@mock.patch("juju_spell.assignment.runner.get_controller", new_callable=mock.AsyncMock)
+@mock.patch("juju_spell.assignment.runner.get_result")
+async def test_run_concurrently(
+    mock_get_result, mock_get_controller, number_of_controllers, run_func
+):
+    """Test run in parallel and in batches keeps order of controllers."""
+    config = mock.MagicMock()
+    config.controllers = [MagicMock() for _ in range(number_of_controllers)]
+    command = mock.AsyncMock()
+    command.pre_check.return_value = None
+    command.run.side_effect = lambda controller, controller_config, **_: controller_config
+    mock_get_result.side_effect = lambda controller_config, output: output
+
+    result = await run_func(config, command, argparse.Namespace(dry_run=False))
+
+    assert result == config.controllers
+    assert command.run.await_count == number_of_controllers
+    for controller_config in config.controllers:
+        command.run.assert_any_await(
+            controller=mock_get_controller.return_value,
+            dry_run=False,
+            controller_config=controller_config,
+        )
+
+
+@pytest.mark.parametrize("run_func", [run_serial, run_parallel, run_batch])
+@mock.patch("juju_spell.assignment.runner.get_controller", new_callable=mock.AsyncMock)
+async def test_run_failure(mock_get_controller, run_func):
+    """Test that failure on one controller does not affect others."""
+    config = mock.MagicMock()
+    config.controllers = [MagicMock(), MagicMock(), MagicMock()]
+    exp_error = ValueError("connection failed")
+    mock_get_controller.side_effect = [MagicMock(), exp_error, MagicMock()]
+    command = mock.AsyncMock()
+    command.pre_check.return_value = None
+    command.run.return_value = Result(True, "OK")
+
+    result = await run_func(config, command, argparse.Namespace(dry_run=False))
+
+    assert [output["success"] for output in result] == [True, False, True]
+    assert str(result[1]["error"]) == str(exp_error)
+    assert command.run.await_count == 2
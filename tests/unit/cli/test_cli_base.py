@@ -118,7 +118,6 @@ def test_base_juju_cmd_fill_parser(
     )
 
 
-@pytest.mark.asyncio
 @patch("juju_spell.cli.base.run", new_callable=MagicMock)
 @patch("juju_spell.cli.base.asyncio")
 @patch("juju_spell.cli.base.get_filtered_config")
@@ -132,11 +131,29 @@ async def test_base_juju_cmd_execute(mock_get_filtered_config, mock_asyncio, _,
 
     mock_get_filtered_config.assert_called_once_with(base_juju_cmd.config, None)
     mock_asyncio.get_event_loop.assert_called_once()
+    loop.set_task_factory.assert_called_once_with(mock_asyncio.eager_task_factory)
     loop.create_task.assert_called_once()
     loop.run_until_complete.assert_called_once()
     assert result == task.result.return_value
 
 
+@patch("juju_spell.cli.base.run", new_callable=MagicMock)
+@patch("juju_spell.cli.base.asyncio")
+@patch("juju_spell.cli.base.get_filtered_config")
+def test_base_juju_cmd_execute_without_eager_task_factory(_, mock_asyncio, __, base_juju_cmd):
+    """Test that default task factory is kept if eager task factory is not available."""
+    parsed_args = argparse.Namespace(**{"filter": None})
+    del mock_asyncio.eager_task_factory  # not available before Python 3.12
+    mock_asyncio.get_event_loop.return_value = loop = MagicMock()
+    task = loop.create_task.return_value = MagicMock()
+
+    result = base_juju_cmd.execute_cli(parsed_args)
+
+    loop.set_task_factory.assert_not_called()
+    loop.run_until_complete.assert_called_once()
+    assert result == task.result.return_value
+
+
 def test_base_juju_cmd_execute_exception(base_juju_cmd):
     """Test add additional CLI arguments with BaseJujuCMD."""
     parsed_args = argparse.Namespace(**{"filter": None})
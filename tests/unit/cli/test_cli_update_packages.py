@@ -1,5 +1,6 @@
 import argparse
 import io
+import json
 import uuid
 from pathlib import Path
 from unittest import mock
@@ -9,7 +10,10 @@ import yaml
 
 from juju_spell.cli import UpdatePackages
 from juju_spell.cli.update_packages import get_patch_config
+from juju_spell.cli.utils import parse_positive_int
 from juju_spell.commands.update_packages import Application, PackageToUpdate, Updates
+from juju_spell.exceptions import JujuSpellError
+from juju_spell.settings import DEFAULT_PARALLEL_UNITS
 from juju_spell.utils import load_yaml_file
 
 TEST_PATCH = """
@@ -47,10 +51,16 @@ def test_fill_parser():
     cmd.fill_parser(parser)
 
     # This one is to check the basic arguments is been added.
-    assert parser.add_argument.call_count == 6
+    assert parser.add_argument.call_count == 7
     parser.add_argument.assert_has_calls(
         [
             mock.call("--patch", type=get_patch_config, help="patch file", required=True),
+            mock.call(
+                "--parallel-units",
+                type=parse_positive_int,
+                default=DEFAULT_PARALLEL_UNITS,
+                help=mock.ANY,
+            ),
         ]
     )
 
@@ -66,6 +76,18 @@ def test_load_yaml_file(tmp_path, input_yaml):
     assert result == yaml.safe_load(io.StringIO(input_yaml))
 
 
+@pytest.mark.parametrize("input_yaml", [TEST_PATCH])
+def test_load_yaml_file_json(tmp_path, input_yaml):
+    """Test load_patch_file with a json file."""
+    expected = yaml.safe_load(io.StringIO(input_yaml))
+    file_path = tmp_path / f"{uuid.uuid4()}.json"
+    with open(file_path, "w", encoding="utf8") as file:
+        json.dump(expected, file)
+
+    result = load_yaml_file(file_path)
+    assert result == expected
+
+
 @pytest.mark.parametrize("input_yaml", [TEST_PATCH])
 @mock.patch("juju_spell.utils.load_yaml_file")
 def test_get_patch_config(mock_load_patch_file, input_yaml):
@@ -75,3 +97,22 @@ def test_get_patch_config(mock_load_patch_file, input_yaml):
     real: Updates = get_patch_config(file_path="test")
     assert real == TEST_UPDATES
     mock_load_patch_file.assert_called_once_with(Path("test"))
+
+
+@mock.patch("juju_spell.utils.load_yaml_file")
+def test_get_patch_config_errors(mock_load_patch_file):
+    """Test get_patch_config with invalid input."""
+    mock_load_patch_file.return_value = {
+        "applications": [
+            {"application": "^nova.*$", "dist_upgrade": "yes"},
+            {"application": "^nova[$"},
+            {"application": 1},
+        ]
+    }
+
+    with pytest.raises(JujuSpellError) as error:
+        get_patch_config(file_path="test")
+
+    assert "application['^nova.*$'].dist_upgrade should be bool" in str(error.value)
+    assert "application['^nova[$'] is not a valid regular expression" in str(error.value)
+    assert "application['1'] is not a valid regular expression" in str(error.value)
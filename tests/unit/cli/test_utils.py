@@ -8,6 +8,7 @@ from juju_spell.cli.utils import (
     confirm,
     parse_comma_separated_str,
     parse_filter,
+    parse_positive_int,
 )
 from juju_spell.exceptions import AbortError, JujuSpellError
 
@@ -106,3 +107,16 @@ def test_parse_filter_exception(value):
     """Test parse_filter raising exception."""
     with pytest.raises(ArgumentTypeError):
         parse_filter(value)
+
+
+@pytest.mark.parametrize("value, exp_result", [("1", 1), ("32", 32)])
+def test_parse_positive_int(value, exp_result):
+    """Test parse_positive_int with valid value."""
+    assert parse_positive_int(value) == exp_result
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "a", "1.5"])
+def test_parse_positive_int_exception(value):
+    """Test parse_positive_int raising exception."""
+    with pytest.raises(ArgumentTypeError):
+        parse_positive_int(value)
@@ -1,17 +1,34 @@
 from unittest.mock import AsyncMock
 
 import pytest
+import yaml
 
 from juju_spell.commands.base import BaseJujuCommand
+from juju_spell.config import _validate_config
+from tests.unit.conftest import TEST_COMPLETE_CONFIG
 
 
 class TestJujuCommand(BaseJujuCommand):
     execute = AsyncMock()
 
 
+@pytest.fixture(scope="module")
+def juju_command_instance():
+    """Return test juju command object shared by module."""
+    return TestJujuCommand()
+
+
 @pytest.fixture
-def test_juju_command():
-    """Return test juju command object."""
-    command = TestJujuCommand()
-    command.execute.reset_mock()
-    yield command
+def test_juju_command(juju_command_instance):
+    """Return test juju command object with reset execute mock."""
+    juju_command_instance.execute.reset_mock(return_value=True, side_effect=True)
+    yield juju_command_instance
+
+
+@pytest.fixture(scope="session")
+def validated_controller():
+    """Return first controller from validated test config.
+
+    The controller is only read by tests, so it is validated once per session.
+    """
+    return _validate_config(yaml.safe_load(TEST_COMPLETE_CONFIG)).controllers[0]
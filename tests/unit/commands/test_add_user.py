@@ -1,16 +1,14 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from juju.errors import JujuError
 
 from juju_spell.commands.add_user import AddUserCommand
 from juju_spell.commands.base import Result
-from juju_spell.config import _validate_config
 from juju_spell.exceptions import JujuSpellError
 
 
-@pytest.mark.asyncio
-async def test_add_user_execute(test_config_dict):
+async def test_add_user_execute(validated_controller):
     """Check add_user cmd execute."""
     cmd = AddUserCommand()
 
@@ -23,14 +21,13 @@ async def test_add_user_execute(test_config_dict):
     mock_user.username = "new-user"
     mock_user.display_name = "new-user-display-name"
 
-    controller = _validate_config(test_config_dict).controllers[0]
     output = await cmd.execute(
         mock_conn,
         **{
             "user": "new-user",
             "password": "new-user-pwd",
             "display_name": "new-user-display-name",
-            "controller_config": controller,
+            "controller_config": validated_controller,
         },
     )
     mock_conn.add_user.assert_awaited_once_with(
@@ -47,7 +44,6 @@ async def test_add_user_execute(test_config_dict):
     }
 
 
-@pytest.mark.asyncio
 @patch("juju_spell.commands.add_user.EnableUserCommand")
 @patch("juju_spell.commands.add_user.GrantCommand")
 @pytest.mark.parametrize(
@@ -60,13 +56,11 @@ async def test_add_user_execute(test_config_dict):
 async def test_add_user_execute_grant(
     mock_grant_cmd,
     mock_enable_user_cmd,
-    test_config_dict,
     acl,
     overwrite,
     grant_result,
 ):
     """Check if grant cmd has been called when acl is in params."""
-    cmd = AddUserCommand()
     mock_conn = AsyncMock()
 
     mock_conn.get_user.return_value = None
@@ -76,15 +70,14 @@ async def test_add_user_execute_grant(
     mock_user.username = "new-user"
     mock_user.display_name = "new-user-display-name"
 
-    _mock_grant_cmd = AsyncMock()
+    _mock_grant_cmd = Mock(run=AsyncMock(return_value=grant_result))
     mock_grant_cmd.return_value = _mock_grant_cmd
-    _mock_grant_cmd.run.return_value = grant_result
 
-    _mock_enable_user_cmd = AsyncMock()
+    _mock_enable_user_cmd = Mock(run=AsyncMock(return_value=Result(success=True)))
     mock_enable_user_cmd.return_value = _mock_enable_user_cmd
-    _mock_enable_user_cmd.run.return_value = Result(success=True)
 
-    controller = _validate_config(test_config_dict).controllers[0]
+    cmd = AddUserCommand()
+    controller_config = Mock()  # only forwarded to grant command
 
     output = await cmd.execute(
         mock_conn,
@@ -92,19 +85,20 @@ async def test_add_user_execute_grant(
             "user": "new-user",
             "password": "new-user-pwd",
             "display_name": "new-user-display-name",
-            "controller_config": controller,
+            "controller_config": controller_config,
             "acl": acl,
             "overwrite": overwrite,
         },
     )
 
+    _mock_enable_user_cmd.run.assert_awaited_once()
     _mock_grant_cmd.run.assert_awaited_once_with(
         controller=mock_conn,
         **{
             "user": "new-user",
             "password": "new-user-pwd",
             "display_name": "new-user-display-name",
-            "controller_config": controller,
+            "controller_config": controller_config,
             "acl": acl,
             "overwrite": overwrite,
         },
@@ -119,7 +113,6 @@ async def test_add_user_execute_grant(
         assert output == grant_result
 
 
-@pytest.mark.asyncio
 @patch("juju_spell.commands.add_user.GrantCommand")
 @patch("juju_spell.commands.add_user.EnableUserCommand")
 @pytest.mark.parametrize(
@@ -130,10 +123,8 @@ async def test_add_user_execute_grant(
     ],
 )
 async def test_add_user_overwrite(
-    mock_grant_cmd, mock_enable_user_cmd, test_config_dict, overwrite
+    mock_grant_cmd, mock_enable_user_cmd, validated_controller, overwrite
 ):
-    cmd = AddUserCommand()
-
     mock_conn = AsyncMock()
     mock_conn.add_user.side_effect = JujuError()
 
@@ -150,7 +141,7 @@ async def test_add_user_overwrite(
     mock_enable_user_cmd.return_value = _mock_enable_user_cmd
     _mock_enable_user_cmd.run.return_value = Result(success=False)
 
-    controller = _validate_config(test_config_dict).controllers[0]
+    cmd = AddUserCommand()
 
     if overwrite:
         output = await cmd.execute(
@@ -159,7 +150,7 @@ async def test_add_user_overwrite(
                 "user": "new-user",
                 "password": "new-user-pwd",
                 "display_name": "new-user-display-name",
-                "controller_config": controller,
+                "controller_config": validated_controller,
                 "acl": "superuser",
                 "overwrite": overwrite,
             },
@@ -180,7 +171,7 @@ async def test_add_user_overwrite(
                 "user": "new-user",
                 "password": "new-user-pwd",
                 "display_name": "new-user-display-name",
-                "controller_config": controller,
+                "controller_config": validated_controller,
                 "acl": "superuser",
                 "overwrite": overwrite,
             },
@@ -17,8 +17,6 @@
 """JujuSpell tests for base juju command."""
 from unittest import mock
 
-import pytest
-
 from juju_spell.exceptions import JujuSpellError
 
 
@@ -28,7 +26,6 @@ class TestBaseJujuCommand:
         assert test_juju_command.name == "TestJujuCommand"
         assert test_juju_command.logger.name == test_juju_command.name
 
-    @pytest.mark.asyncio
     async def test_dry_run(self, test_juju_command):
         controller = mock.MagicMock()
         controller.controller_uuid = "abc"
@@ -40,7 +37,6 @@ class TestBaseJujuCommand:
             "command_doc": "exec_doc",
         }
 
-    @pytest.mark.asyncio
     async def test_pre_check(self, test_juju_command):
         """Test pre_check function."""
         controller = mock.MagicMock()
@@ -50,7 +46,6 @@ class TestBaseJujuCommand:
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_pre_check_failed(self, test_juju_command):
         """Test failure of pre_check function."""
         controller = mock.MagicMock()
@@ -64,7 +59,6 @@ class TestBaseJujuCommand:
         assert isinstance(result.error, JujuSpellError)
         assert str(result.error) == "controller 1234 is not connected"
 
-    @pytest.mark.asyncio
     async def test_run(self, test_juju_command):
         """Test run function."""
         test_juju_command.execute.return_value = exp_output = {"test": "value"}
@@ -75,7 +69,6 @@ class TestBaseJujuCommand:
         assert result.output == exp_output
         assert result.error is None
 
-    @pytest.mark.asyncio
     async def test_run_exception(self, test_juju_command):
         """Test failure in run function."""
         test_juju_command.execute.side_effect = exp_error = Exception("test")
@@ -1,9 +1,10 @@
-from unittest.mock import AsyncMock, MagicMock, call
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
+from juju_spell.settings import DEFAULT_MODELS_CACHE_TTL
+
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "all_models, args_models, exp_models, model_mappings",
     [
@@ -60,7 +61,7 @@ async def test_get_filtered_models_mapping(
     all_models, args_models, exp_models, model_mappings, test_juju_command
 ):
     """Test async models generator."""
-    mock_controller = AsyncMock()
+    mock_controller = AsyncMock(get_current_username=MagicMock(return_value="admin"))
     mock_controller.list_models.return_value = all_models
     mock_controller.get_model.return_value = mock_model = AsyncMock()
 
@@ -77,7 +78,27 @@ async def test_get_filtered_models_mapping(
     assert mock_model.disconnect.await_count == len(models)
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "args_models, exp_uuids",
+    [
+        (None, ["uuid-1", "uuid-2"]),
+        (["model2"], ["uuid-2"]),
+        (["uuid-3"], ["uuid-3"]),
+    ],
+)
+async def test_get_filtered_model_uuids(args_models, exp_uuids, test_juju_command):
+    """Test getting model UUIDs without connecting to models."""
+    mock_controller = AsyncMock(get_current_username=MagicMock(return_value="admin"))
+    mock_controller.list_models.return_value = ["model1", "model2"]
+    mock_controller.model_uuids.return_value = {"model1": "uuid-1", "model2": "uuid-2"}
+
+    uuids = await test_juju_command.get_filtered_model_uuids(mock_controller, {}, args_models)
+
+    assert uuids == exp_uuids
+    mock_controller.model_uuids.assert_awaited_once()
+    mock_controller.get_model.assert_not_called()
+
+
 async def test_run(test_juju_command):
     """Test run for any juju command."""
     mock_controller = MagicMock()
@@ -90,3 +111,60 @@ async def test_run(test_juju_command):
 def test_need_shuttle(test_juju_command):
     """Test default return value for need_shuttle property."""
     assert test_juju_command.need_sshuttle is False
+
+
+@pytest.mark.parametrize(
+    "refresh, elapsed, exp_awaits",
+    [
+        (False, 0, 1),
+        (True, 0, 2),
+        (False, DEFAULT_MODELS_CACHE_TTL + 1, 2),
+    ],
+)
+async def test_get_filtered_model_names_cached(refresh, elapsed, exp_awaits, test_juju_command):
+    """Test reusing recently listed models."""
+    mock_controller = AsyncMock(get_current_username=MagicMock(return_value="admin"))
+    mock_controller.list_models.return_value = ["model1", "model2"]
+
+    with patch("juju_spell.commands.base.time.monotonic", return_value=100):
+        await test_juju_command.get_filtered_model_names(mock_controller, {})
+
+    with patch("juju_spell.commands.base.time.monotonic", return_value=100 + elapsed):
+        models = await test_juju_command.get_filtered_model_names(
+            mock_controller, {}, refresh=refresh
+        )
+
+    assert models == ["model1", "model2"]
+    assert mock_controller.list_models.await_count == exp_awaits
+
+
+async def test_get_filtered_model_names_cached_per_user(test_juju_command):
+    """Test that models listed by different users are cached separately."""
+    mock_controller = AsyncMock(get_current_username=MagicMock(return_value="admin"))
+    mock_controller.list_models.return_value = ["model1", "model2"]
+
+    await test_juju_command.get_filtered_model_names(mock_controller, {})
+    await test_juju_command.get_filtered_model_names(mock_controller, {})
+    mock_controller.get_current_username.return_value = "gandalf"
+    await test_juju_command.get_filtered_model_names(mock_controller, {})
+
+    assert mock_controller.list_models.await_count == 2
+
+
+async def test_get_filtered_model_names_mapping_not_cached(test_juju_command):
+    """Test that models filtered by mappings are not taken from cache."""
+    mock_controller = AsyncMock(get_current_username=MagicMock(return_value="admin"))
+    mock_controller.list_models.return_value = ["model1", "model2"]
+
+    all_models = await test_juju_command.get_filtered_model_names(mock_controller, {})
+    models = await test_juju_command.get_filtered_model_names(
+        mock_controller, {"lma": ["monitoring"]}, models=["lma"]
+    )
+    mapped_models = await test_juju_command.get_filtered_model_names(
+        mock_controller, {"lma": ["cos"]}, models=["lma"]
+    )
+
+    assert all_models == ["model1", "model2"]
+    assert models == ["monitoring"]
+    assert mapped_models == ["cos"]
+    mock_controller.list_models.assert_awaited_once()
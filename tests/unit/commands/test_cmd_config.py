@@ -2,8 +2,6 @@ import copy
 from typing import Dict
 from unittest.mock import AsyncMock
 
-import pytest as pytest
-
 from juju_spell.commands.config import (
     ApplicationConfig,
     ConfigCommand,
@@ -68,7 +66,6 @@ def _mock_controller(model):
     return controller, controller_config
 
 
-@pytest.mark.asyncio
 async def test_execute_get_single_config():
     model = _mock_model(MockApp())
     controller, controller_config = _mock_controller(model)
@@ -83,7 +80,6 @@ async def test_execute_get_single_config():
     assert result == {"lma": {"ubuntu": {"hostname": "osman"}}}
 
 
-@pytest.mark.asyncio
 async def test_execute_get_config():
     model = _mock_model(MockApp())
     controller, controller_config = _mock_controller(model)
@@ -95,7 +91,6 @@ async def test_execute_get_config():
     assert result == {"lma": {"ubuntu": SIMPLE_CONFIG}}
 
 
-@pytest.mark.asyncio
 async def test_execute_set_multiple_config():
     ubuntu_set_config = {"hostname": "xxx", "xx": "44"}
     ubuntu_expected_config = {"hostname": "xxx", "xx": "44"}
@@ -114,7 +109,6 @@ async def test_execute_set_multiple_config():
     assert result == {"lma": {"ubuntu": ubuntu_expected_config}}
 
 
-@pytest.mark.asyncio
 async def test_execute_set_from_file():
     ubuntu_set_config = {"hostname": "xxx", "xx": "44"}
     ubuntu_expected_config = {"hostname": "xxx", "xx": "44"}
@@ -131,7 +125,6 @@ async def test_execute_set_from_file():
     assert result == {"lma": {"ubuntu": ubuntu_expected_config}}
 
 
-@pytest.mark.asyncio
 async def test_apply_file_config():
     ubuntu_set_config = {"hostname": "xxx", "xx": "44"}
     ubuntu_expected_config = {"hostname": "xxx", "xx": "44"}
@@ -143,7 +136,6 @@ async def test_apply_file_config():
     assert retval == {"ubuntu": ubuntu_expected_config}
 
 
-@pytest.mark.asyncio
 async def test_apply_configuration_get_single_config():
     model = _mock_model(MockApp())
     kwargs = {
@@ -155,7 +147,6 @@ async def test_apply_configuration_get_single_config():
     assert result == {"ubuntu": {"hostname": "osman"}}
 
 
-@pytest.mark.asyncio
 async def test_apply_configuration_get_config():
     expected = {"ubuntu": {"hostname": "osman", "xx": "xx", "others": "xx"}}
     model = _mock_model(MockApp())
@@ -166,7 +157,6 @@ async def test_apply_configuration_get_config():
     assert result == expected
 
 
-@pytest.mark.asyncio
 async def test_apply_configuration_set_multiple_config():
     ubuntu_set_config = {"hostname": "xxx", "xx": "44"}
     ubuntu_expected_config = {"hostname": "xxx", "xx": "44"}
@@ -181,7 +171,6 @@ async def test_apply_configuration_set_multiple_config():
     assert result == {"ubuntu": ubuntu_expected_config}
 
 
-@pytest.mark.asyncio
 async def test_apply_configuration_set_from_file():
     ubuntu_set_config = {"hostname": "xxx", "xx": "44"}
     ubuntu_expected_config = {"hostname": "xxx", "xx": "44"}
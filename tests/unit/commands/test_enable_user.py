@@ -1,11 +1,8 @@
 from unittest.mock import AsyncMock
 
-import pytest
+from juju_spell.commands.enable_user import DisableUserCommand, EnableUserCommand
 
-from juju_spell.commands.enable_user import EnableUserCommand
 
-
-@pytest.mark.asyncio
 async def test_enable_user_execute():
     cmd = EnableUserCommand()
 
@@ -14,3 +11,13 @@ async def test_enable_user_execute():
     await cmd.execute(mock_conn, **{"user": "new-user"})
 
     mock_conn.enable_user.assert_awaited_once_with(**{"username": "new-user"})
+
+
+async def test_disable_user_execute():
+    cmd = DisableUserCommand()
+
+    mock_conn = AsyncMock()
+
+    await cmd.execute(mock_conn, **{"user": "new-user"})
+
+    mock_conn.disable_user.assert_awaited_once_with(**{"username": "new-user"})
@@ -1,14 +1,14 @@
-from unittest.mock import AsyncMock, call, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from juju.errors import JujuError
 
 from juju_spell.commands.grant import GrantCommand
 from juju_spell.config import _validate_config
-from tests.unit.utils import _async_generator
 
 
-@pytest.mark.asyncio
-@patch("juju_spell.commands.grant.GrantCommand.get_filtered_models")
+@patch("juju_spell.commands.grant.GrantCommand.grant_models")
+@patch("juju_spell.commands.grant.GrantCommand.get_filtered_model_uuids")
 @pytest.mark.parametrize(
     "acl,exp_controller_acl,exp_model_acl",
     (
@@ -18,6 +18,7 @@ from tests.unit.utils import _async_generator
 )
 async def test_grant_execute(
     mocked_models,
+    mocked_grant_models,
     test_config_dict,
     acl,
     exp_controller_acl,
@@ -25,12 +26,11 @@ async def test_grant_execute(
 ):
     cmd = GrantCommand()
 
-    mock_model1 = AsyncMock()
-    mock_model1.uuid = "0050e762-9002-4197-b163-64bda52427db"
-    mock_model2 = AsyncMock()
-    mock_model2.uuid = "ab9065d4-f762-4386-85e1-5fd892453b68"
-    models = [("model1", mock_model1), ("model2", mock_model2)]
-    mocked_models.return_value = _async_generator(models)
+    model_uuids = {
+        "model1": "0050e762-9002-4197-b163-64bda52427db",
+        "model2": "ab9065d4-f762-4386-85e1-5fd892453b68",
+    }
+    mocked_models.return_value = list(model_uuids.values())
 
     mock_conn = AsyncMock()
 
@@ -43,7 +43,7 @@ async def test_grant_execute(
             "user": "new-user",
             "acl": acl,
             "controller_config": controller,
-        }
+        },
     )
 
     mock_conn.grant.assert_awaited_once_with(
@@ -58,17 +58,61 @@ async def test_grant_execute(
         models=None,
         model_mappings=None,
     )
-    mock_conn.grant_model.assert_has_awaits(
-        [
-            call(
-                username="new-user",
-                model_uuid=mock_model1.uuid,
-                acl=exp_model_acl,
-            ),
-            call(
-                username="new-user",
-                model_uuid=mock_model2.uuid,
-                acl=exp_model_acl,
-            ),
-        ]
+    mocked_grant_models.assert_awaited_once_with(
+        mock_conn,
+        "new-user",
+        [model_uuids["model1"], model_uuids["model2"]],
+        exp_model_acl,
     )
+
+
+@patch("juju_spell.commands.grant.GrantCommand.grant_models")
+@patch("juju_spell.commands.grant.GrantCommand.get_filtered_model_uuids")
+@pytest.mark.parametrize("overwrite", [True, False])
+async def test_grant_execute_model_failure(
+    mocked_models, mocked_grant_models, test_config_dict, overwrite
+):
+    cmd = GrantCommand()
+
+    model_uuids = {
+        "model1": "0050e762-9002-4197-b163-64bda52427db",
+        "model2": "ab9065d4-f762-4386-85e1-5fd892453b68",
+    }
+    mocked_models.return_value = list(model_uuids.values())
+
+    mock_conn = AsyncMock()
+    mocked_grant_models.side_effect = JujuError(["model2 failed"])
+
+    controller = _validate_config(test_config_dict).controllers[0]
+    controller.model_mapping = None
+    kwargs = {
+        "user": "new-user",
+        "acl": "superuser",
+        "controller_config": controller,
+        "overwrite": overwrite,
+    }
+
+    if overwrite:
+        assert await cmd.execute(mock_conn, **kwargs) is True
+    else:
+        with pytest.raises(JujuError):
+            await cmd.execute(mock_conn, **kwargs)
+
+    mocked_grant_models.assert_awaited_once()
+
+
+@patch("juju.client.client.ModelManagerFacade.from_connection")
+async def test_grant_models(mocked_facade):
+    """Test granting access to multiple models with single API call."""
+    mock_conn = MagicMock()
+    model_facade = mocked_facade.return_value = AsyncMock()
+    model_uuids = ["0050e762-9002-4197-b163-64bda52427db", "ab9065d4-f762-4386-85e1-5fd892453b68"]
+
+    await GrantCommand.grant_models(mock_conn, "new-user", model_uuids, "admin")
+
+    mocked_facade.assert_called_once_with(mock_conn.connection.return_value)
+    model_facade.ModifyModelAccess.assert_awaited_once()
+    changes = model_facade.ModifyModelAccess.call_args.kwargs["changes"]
+    assert [
+        (change.access, change.action, change.model_tag, change.user_tag) for change in changes
+    ] == [("admin", "grant", f"model-{model_uuid}", "user-new-user") for model_uuid in model_uuids]
@@ -5,14 +5,14 @@ import pytest
 from juju_spell.commands import list_models
 from juju_spell.commands.list_models import ListModelsCommand
 from juju_spell.exceptions import JujuSpellError
+from juju_spell.utils import Cache
 
 
-@pytest.mark.asyncio
 @patch("juju_spell.commands.list_models.save_to_cache")
 @patch("juju_spell.commands.list_models.load_from_cache")
 async def test_execute_with_refresh(mock_load_from_cache, mock_save_to_cache):
     """Test execute function for ListModelsCommand with --refresh."""
-    mock_controller = AsyncMock()
+    mock_controller = AsyncMock(get_current_username=Mock(return_value="admin"))
     mock_controller_config = Mock()
     list_models = ListModelsCommand()
 
@@ -29,12 +29,11 @@ async def test_execute_with_refresh(mock_load_from_cache, mock_save_to_cache):
     assert context["data"]["refresh"] is True
 
 
-@pytest.mark.asyncio
 @patch("juju_spell.commands.list_models.save_to_cache")
 @patch("juju_spell.commands.list_models.load_from_cache")
 async def test_11_execute_without_refresh_no_cache(mock_load_from_cache, mock_save_to_cache):
     """Test execute function for ListModelsCommand without --refresh and no existing cache."""
-    mock_controller = AsyncMock()
+    mock_controller = AsyncMock(get_current_username=Mock(return_value="admin"))
     mock_controller_config = Mock()
     list_models = ListModelsCommand()
 
@@ -52,57 +51,65 @@ async def test_11_execute_without_refresh_no_cache(mock_load_from_cache, mock_sa
     mock_controller.list_models.assert_awaited_once()
 
 
+@pytest.mark.parametrize("side_effect, failed", [(None, False), (JujuSpellError(), True)])
 @patch("juju_spell.commands.list_models.save_to_cache")
-def test_20_save_cache_data_okay(mock_save_to_cache):
-    """Test save_cache_data function when save cache is okay."""
+def test_20_save_cache_data(mock_save_to_cache, side_effect, failed):
+    """Test save_cache_data function when save cache is okay or not."""
     mock_models = Mock()
     mock_logger = Mock()
 
+    mock_save_to_cache.side_effect = side_effect
     list_models.save_cache_data(Mock(), mock_models, Mock(), mock_logger, Mock())
 
-    mock_logger.debug.assert_called_once()
-    mock_logger.warning.assert_not_called()
-    mock_save_to_cache.assert_called_once()
-
-
-@patch("juju_spell.commands.list_models.save_to_cache")
-def test_21_save_cache_data_fail(mock_save_to_cache):
-    """Test save_cache_data function when save cache is not okay."""
-    mock_models = Mock()
-    mock_logger = Mock()
-
-    mock_save_to_cache.side_effect = JujuSpellError()
-    list_models.save_cache_data(Mock(), mock_models, Mock(), mock_logger, Mock())
-
-    mock_logger.debug.assert_not_called()
-    mock_logger.warning.assert_called_once()
+    assert mock_logger.debug.call_count == int(not failed)
+    assert mock_logger.warning.call_count == int(failed)
     mock_save_to_cache.assert_called_once()
 
 
+@pytest.mark.parametrize("side_effect, failed", [(None, False), (JujuSpellError(), True)])
 @patch("juju_spell.commands.list_models.load_from_cache")
-def test_30_load_cache_data_okay(mock_load_from_cache):
-    """Test load_cache_data function when load cache is okay."""
+def test_30_load_cache_data(mock_load_from_cache, side_effect, failed):
+    """Test load_cache_data function when load cache is okay or not."""
     mock_uuid = Mock()
     mock_name = Mock()
     mock_logger = Mock()
 
+    mock_load_from_cache.side_effect = side_effect
+    mock_load_from_cache.return_value = Cache("uuid", "name", {"refresh": True}, 0)
     list_models.load_cache_data(mock_name, mock_logger, mock_uuid)
 
-    mock_logger.debug.assert_called_once()
-    mock_logger.warning.assert_not_called()
+    assert mock_logger.debug.call_count == int(not failed)
+    assert mock_logger.warning.call_count == int(failed)
     mock_load_from_cache.assert_called_once()
 
 
 @patch("juju_spell.commands.list_models.load_from_cache")
-def test_31_load_cache_data_fail(mock_load_from_cache):
-    """Test load_cache_data function when load cache is not okay."""
+def test_32_load_cache_data_from_memory(mock_load_from_cache):
+    """Test load_cache_data function reading the cache file only once."""
     mock_uuid = Mock()
-    mock_name = Mock()
     mock_logger = Mock()
+    mock_load_from_cache.return_value = Cache("uuid", "name", {"models": ["m1"]}, 0)
 
-    mock_load_from_cache.side_effect = JujuSpellError()
-    list_models.load_cache_data(mock_name, mock_logger, mock_uuid)
+    first = list_models.load_cache_data("test_32_cache", mock_logger, mock_uuid)
+    first.data["models"] = ["changed"]
+    second = list_models.load_cache_data("test_32_cache", mock_logger, mock_uuid)
 
-    mock_logger.debug.assert_not_called()
-    mock_logger.warning.assert_called_once()
-    mock_load_from_cache.assert_called_once()
+    assert second.data == {"models": ["m1"], "refresh": False}
+    mock_load_from_cache.assert_called_once_with("test_32_cache")
+
+
+@patch("juju_spell.commands.list_models.load_from_cache")
+@patch("juju_spell.commands.list_models.save_to_cache")
+def test_33_load_cache_data_after_save(mock_save_to_cache, mock_load_from_cache):
+    """Test load_cache_data function using the cache saved by the same process."""
+    mock_controller = Mock()
+    mock_controller.controller_uuid = "test-33-uuid"
+
+    cache = list_models.save_cache_data(mock_controller, ["m1"], True, Mock(), "test_33")
+    loaded = list_models.load_cache_data("test_33_test-33-uuid", Mock(), Mock())
+
+    assert loaded == Cache(
+        cache.uuid, cache.name, {"models": ["m1"], "refresh": False}, cache.timestamp
+    )
+    assert cache.data["refresh"] is True
+    mock_load_from_cache.assert_not_called()
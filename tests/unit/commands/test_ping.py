@@ -13,7 +13,6 @@ def _get_mocked_controller(connected: bool) -> AsyncMock:
     return controller
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "controller, exp_result",
     [
@@ -15,18 +15,14 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
-import pytest
-
 from juju_spell.commands.remove_user import RemoveUserCommand
 from juju_spell.config import Controller
-from tests.unit.utils import _async_generator
 
 
-@pytest.mark.asyncio
 @patch("juju_spell.commands.remove_user.DisableUserCommand")
 @patch("juju_spell.commands.remove_user.RevokeCommand")
 @patch("juju_spell.commands.remove_user.RevokeModelCommand")
-@patch("juju_spell.commands.base.BaseJujuCommand.get_filtered_models")
+@patch("juju_spell.commands.base.BaseJujuCommand.get_filtered_model_uuids")
 async def test_remove_user_execute(
     # mock_disable_cmd, mock_revoke_cmd, mock_revoke_model_cmd,  mock_models,
     mock_models,
@@ -37,11 +33,12 @@ async def test_remove_user_execute(
     """Test execute function for RemoveUserCommand."""
     cmd = RemoveUserCommand()
 
-    models = [("model1", AsyncMock()), ("model2", AsyncMock())]
+    models = ["model1", "model2"]
+    model_uuids = ["0050e762-9002-4197-b163-64bda52427db", "ab9065d4-f762-4386-85e1-5fd892453b68"]
 
     controller_config = MagicMock(Controller)
     controller_config.model_mapping = None
-    mock_models.return_value = _async_generator(models)
+    mock_models.return_value = model_uuids
 
     _mock_revoke_cmd = AsyncMock()
     mock_revoke_cmd.return_value = _mock_revoke_cmd
@@ -64,12 +61,15 @@ async def test_remove_user_execute(
         }
     )
     assert output is True
+    mock_models.assert_awaited_once_with(
+        controller=mock_conn, models=models, model_mappings=controller_config.model_mapping
+    )
     _mock_revoke_cmd.run.assert_awaited_once_with(controller=mock_conn, user=user, acl="login")
 
     _mock_revoke_model_cmd.run.assert_has_awaits(
         [
-            call(controller=mock_conn, user=user, model_uuid=models[0][-1].uuid, acl="read"),
-            call(controller=mock_conn, user=user, model_uuid=models[1][-1].uuid, acl="read"),
+            call(controller=mock_conn, user=user, model_uuid=model_uuids[0], acl="read"),
+            call(controller=mock_conn, user=user, model_uuid=model_uuids[1], acl="read"),
         ]
     )
     _mock_disable_cmd.run.assert_awaited_once_with(
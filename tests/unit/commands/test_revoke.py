@@ -1,11 +1,8 @@
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
-
 from juju_spell.commands.revoke import RevokeCommand, RevokeModelCommand
 
 
-@pytest.mark.asyncio
 async def test_revoke_execute():
     mock_conn = AsyncMock()
 
@@ -19,7 +16,6 @@ async def test_revoke_execute():
     )
 
 
-@pytest.mark.asyncio
 async def test_revoke_model_execute():
     mock_conn = AsyncMock()
     mock_model = MagicMock()
@@ -1,11 +1,8 @@
 from unittest.mock import AsyncMock
 
-import pytest
-
 from juju_spell.commands.show_controller import ShowControllerCommand
 
 
-@pytest.mark.asyncio
 async def test_execute():
     """Test execute function for ShowControllerCommand."""
     mock_controller = AsyncMock()
@@ -1,13 +1,10 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from juju_spell.commands.status import StatusCommand
 from juju_spell.config import Controller
 from tests.unit.utils import _async_generator
 
 
-@pytest.mark.asyncio
 @patch("juju_spell.commands.base.BaseJujuCommand.get_filtered_models")
 async def test_execute(mocked_models):
     """Test execute function for StatusCommand."""
@@ -1,3 +1,4 @@
+import asyncio
 import copy
 import uuid
 from unittest.mock import AsyncMock, MagicMock
@@ -147,16 +148,22 @@ def expected_packages(patch_config):
     return patch_config.applications[0].packages_to_update
 
 
-@pytest.fixture(params=[TEST_PATCH])
-def patch_config(request, tmp_path):
-    """Test get_patch_config."""
-    file_path = tmp_path / f"{uuid.uuid4()}.config"
+@pytest.fixture(scope="module", params=[TEST_PATCH])
+def patch_config_source(request, tmp_path_factory):
+    """Load patch config once per module."""
+    file_path = tmp_path_factory.mktemp("patch") / f"{uuid.uuid4()}.config"
     with open(file_path, "w", encoding="utf8") as file:
         file.write(request.param)
 
     return get_patch_config(file_path)
 
 
+@pytest.fixture
+def patch_config(patch_config_source):
+    """Test get_patch_config."""
+    return copy.deepcopy(patch_config_source)
+
+
 async def _mock_controller(model):
     controller = AsyncMock()
     controller.get_model.return_value = model
@@ -239,13 +246,44 @@ def test_get_update_command(patch_config):
 def test_parse_result(unit_update_result):
     update_packages: UpdatePackagesCommand = UpdatePackagesCommand()
     result = update_packages.parse_result(RAW_OUTPUT_INSTALL)
-    assert [p in result for p in unit_update_result.packages] == [True, True]
+    assert set(unit_update_result.packages) <= set(result)
 
     result = update_packages.parse_result(RAW_OUTPUT_DRYRUN)
-    assert [p in result for p in unit_update_result.packages] == [True, True]
+    assert set(unit_update_result.packages) <= set(result)
+
+
+def test_parse_result_new_packages():
+    """Test that newly installed packages without previous version are skipped."""
+    update_packages: UpdatePackagesCommand = UpdatePackagesCommand()
+    raw_output = (
+        "Inst libfoo1 (1.0-1 Ubuntu:22.04/jammy [amd64])\n"
+        "Unpacking libfoo1:amd64 (1.0-1) ...\n"
+        "Unpacking apt (2.4.8) over (2.4.7) ...\n"
+    )
+
+    result = update_packages.parse_result(raw_output)
+
+    assert result == [PackageUpdateResult(package="apt", from_version="2.4.7", to_version="2.4.8")]
+
+
+def test_parse_result_keeps_output_order():
+    """Test that parsed packages are returned in the order they appear in the output."""
+    update_packages: UpdatePackagesCommand = UpdatePackagesCommand()
+    raw_output = (
+        "Unpacking apt (2.4.8) over (2.4.7) ...\n"
+        "Inst rsync [3.2.3-8ubuntu3] (3.2.3-8ubuntu3.1 Ubuntu:22.04/jammy-updates [amd64])\n"
+    )
+
+    result = update_packages.parse_result(raw_output)
+
+    assert result == [
+        PackageUpdateResult(package="apt", from_version="2.4.7", to_version="2.4.8"),
+        PackageUpdateResult(
+            package="rsync", from_version="3.2.3-8ubuntu3", to_version="3.2.3-8ubuntu3.1"
+        ),
+    ]
 
 
-@pytest.mark.asyncio
 async def test_run_updates_on_model(patch_config, unit_update_result):
     update_packages: UpdatePackagesCommand = UpdatePackagesCommand()
     model = await _mock_model(RAW_OUTPUT_DRYRUN)
@@ -266,13 +304,96 @@ async def test_run_updates_on_model(patch_config, unit_update_result):
     ]
 
     await update_packages.run_updates_on_model(model=model, updates=patch_config)
-    assert [
-        p in patch_config.applications[0].results[0].units[0].packages
-        for p in unit_update_result.packages
-    ] == [True, True]
+    assert set(unit_update_result.packages) <= set(
+        patch_config.applications[0].results[0].units[0].packages
+    )
+
+
+@pytest.mark.parametrize("parallel_units, exp_max_running", [(1, 1), (2, 2), (5, 3)])
+async def test_run_updates_on_model_parallel_units(patch_config, parallel_units, exp_max_running):
+    """Test that at most parallel_units units are updated at the same time."""
+    update_packages: UpdatePackagesCommand = UpdatePackagesCommand()
+    running, max_running = 0, 0
+
+    async def _run(**_):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        action = MagicMock()
+        action.data = {"results": {"Stdout": RAW_OUTPUT_DRYRUN}}
+        return action
+
+    unit_names = ["ubuntu/0", "ubuntu/1", "ubuntu/2"]
+    model = AsyncMock()
+    model.units = {name: AsyncMock(run=_run) for name in unit_names}
+    patch_config.applications[0].results = [
+        UpdateResult(
+            application="ubuntu",
+            units=[
+                UnitUpdateResult(unit=name, command=UNIT_UPDATE_COMMAND, packages=[])
+                for name in unit_names
+            ],
+        )
+    ]
+
+    await update_packages.run_updates_on_model(model, patch_config, parallel_units)
+
+    assert max_running == exp_max_running
+    assert all(unit.raw_output for unit in patch_config.applications[0].results[0].units)
+
+
+async def test_run_updates_on_model_failed_unit(patch_config):
+    """Test that failed unit is recorded as unsuccessful update."""
+    update_packages: UpdatePackagesCommand = UpdatePackagesCommand()
+    model = AsyncMock()
+    model.units = {"ubuntu/0": AsyncMock(run=AsyncMock(side_effect=ConnectionError("lost")))}
+    patch_config.applications[0].results = [
+        UpdateResult(
+            application="ubuntu",
+            units=[UnitUpdateResult(unit="ubuntu/0", command=UNIT_UPDATE_COMMAND, packages=[])],
+        )
+    ]
+
+    await update_packages.run_updates_on_model(model, patch_config)
+
+    unit = patch_config.applications[0].results[0].units[0]
+    assert unit.success is False
+    assert unit.error == "lost"
+    assert unit.packages == []
+
+
+async def test_run_updates_on_model_one_failed_unit(patch_config, unit_update_result):
+    """Test that other units report their results if one of them fails."""
+    update_packages: UpdatePackagesCommand = UpdatePackagesCommand()
+    action = MagicMock()
+    action.data = {"results": {"Stdout": RAW_OUTPUT_DRYRUN}}
+    unit_names = ["ubuntu/0", "ubuntu/1", "ubuntu/2"]
+    model = AsyncMock()
+    model.units = {name: AsyncMock(run=AsyncMock(return_value=action)) for name in unit_names}
+    model.units["ubuntu/1"].run.side_effect = TimeoutError("timed out")
+    patch_config.applications[0].results = [
+        UpdateResult(
+            application="ubuntu",
+            units=[
+                UnitUpdateResult(unit=name, command=UNIT_UPDATE_COMMAND, packages=[])
+                for name in unit_names
+            ],
+        )
+    ]
+
+    await update_packages.run_updates_on_model(model, patch_config)
+
+    unit_0, unit_1, unit_2 = patch_config.applications[0].results[0].units
+    assert unit_1.success is False
+    assert unit_1.error == "timed out"
+    for unit in [unit_0, unit_2]:
+        assert unit.error is None
+        assert unit.raw_output == RAW_OUTPUT_DRYRUN
+        assert set(unit_update_result.packages) <= set(unit.packages)
 
 
-@pytest.mark.asyncio
 async def test_make_updates(patch_config, unit_update_result):
     model = await _mock_model(RAW_OUTPUT_DRYRUN)
 
@@ -289,13 +410,34 @@ async def test_make_updates(patch_config, unit_update_result):
     )
 
     assert result.success
-    assert [
-        p in result.output["lma"].applications[0].results[0].units[0].packages
-        for p in unit_update_result.packages
-    ] == [True, True]
+    assert set(unit_update_result.packages) <= set(
+        result.output["lma"].applications[0].results[0].units[0].packages
+    )
+
+
+async def test_make_updates_multiple_models(patch_config):
+    model = await _mock_model(RAW_OUTPUT_DRYRUN)
+
+    controller = AsyncMock()
+    controller.get_model.return_value = model
+
+    update_packages: UpdatePackagesCommand = UpdatePackagesCommand()
+    result = await update_packages.make_updates(
+        controller=controller,
+        updates=patch_config,
+        models=["lma", "default"],
+        model_mapping=None,
+        dry_run=False,
+    )
+
+    lma_app = result.output["lma"].applications[0]
+    default_app = result.output["default"].applications[0]
+    # each model has its own results, while the input stays untouched
+    assert lma_app.results is not default_app.results
+    assert len(lma_app.results) == len(default_app.results) == 1
+    assert patch_config.applications[0].results == []
 
 
-@pytest.mark.asyncio
 async def test_execute(patch_config, unit_update_result):
     model = await _mock_model(RAW_OUTPUT_DRYRUN)
     controller, controller_config = await _mock_controller(model)
@@ -311,13 +453,11 @@ async def test_execute(patch_config, unit_update_result):
         },
     )
     assert result.success
-    assert [
-        p in result.output["lma"].applications[0].results[0].units[0].packages
-        for p in unit_update_result.packages
-    ] == [True, True]
+    assert set(unit_update_result.packages) <= set(
+        result.output["lma"].applications[0].results[0].units[0].packages
+    )
 
 
-@pytest.mark.asyncio
 async def test_dry_run(patch_config, unit_update_result):
     model = await _mock_model(RAW_OUTPUT_DRYRUN)
     controller, controller_config = await _mock_controller(model)
@@ -333,7 +473,6 @@ async def test_dry_run(patch_config, unit_update_result):
         },
     )
     assert result.success
-    assert [
-        p in result.output["lma"].applications[0].results[0].units[0].packages
-        for p in unit_update_result.packages
-    ] == [True, True]
+    assert set(unit_update_result.packages) <= set(
+        result.output["lma"].applications[0].results[0].units[0].packages
+    )
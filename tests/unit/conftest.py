@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 import yaml
 
+from juju_spell.commands import base, list_models
 from juju_spell.config import Config, Connection, Controller
 
 TEST_CONFIG = """
@@ -100,6 +101,14 @@ controllers:
 """
 
 
+@pytest.fixture(autouse=True)
+def clear_command_caches():
+    """Clear in-memory command caches, so tests do not depend on each other."""
+    yield
+    list_models._memory_cache.clear()
+    base._models_cache.clear()
+
+
 @pytest.fixture
 def test_config_path(tmp_path) -> Path:
     """Return path to test global config."""
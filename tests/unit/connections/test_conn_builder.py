@@ -10,7 +10,6 @@ from juju_spell.config import RetryPolicy
 from juju_spell.settings import DEFAULT_CONNECTION_WAIT, DEFAULT_MAX_FRAME_SIZE
 
 
-@pytest.mark.asyncio
 async def test_build_controller_conn():
     """Test direct connection to controller with reties."""
     from juju_spell.connections.conn_builder import build_controller_conn
@@ -50,7 +49,6 @@ async def test_build_controller_conn():
     assert mock_controller._connector.controller_name == name
 
 
-@pytest.mark.asyncio
 async def test_build_controller_conn_exception():
     """Test direct connection to controller with reties."""
     from juju_spell.connections.conn_builder import build_controller_conn
@@ -66,7 +64,6 @@ async def test_build_controller_conn_exception():
         )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "retry_policy,exp_args",
     [
@@ -147,7 +144,6 @@ async def test_build_controller_conn_retry_policy(
     )
 
 
-@pytest.mark.asyncio
 @mock.patch("juju_spell.connections.conn_builder.Retrying")
 @mock.patch("juju_spell.connections.conn_builder._after_log")
 @mock.patch("juju_spell.connections.conn_builder._before_log")
@@ -1,3 +1,4 @@
+import asyncio
 import copy
 import io
 import unittest
@@ -90,7 +91,7 @@ class TestConnectManager(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(connect_manager1, connect_manager2)
         self.assertEqual(connect_manager1.connections, connect_manager2.connections)
 
-    @mock.patch("juju_spell.connections.manager.juju.Controller")
+    @mock.patch("juju.juju.Controller")
     @mock.patch("juju_spell.connections.manager.build_controller_conn")
     async def test_connect(self, mock_build_controller_conn, mock_controller):
         """Test connection with direct access."""
@@ -101,7 +102,7 @@ class TestConnectManager(unittest.IsolatedAsyncioTestCase):
 
         mocked_controller = mock_controller.return_value = AsyncMock()
         with mock.patch("juju_spell.connections.manager.get_connection") as mock_get_connection:
-            mock_get_connection.return_value = exp_endpoint, MagicMock()
+            mock_get_connection.return_value = exp_endpoint, AsyncMock()
             controller = await self.connect_manager._connect(config)
             mock_get_connection.assert_called_once_with(config, False)
 
@@ -118,6 +119,53 @@ class TestConnectManager(unittest.IsolatedAsyncioTestCase):
         )
         assert config.name in self.connect_manager.connections
 
+    @mock.patch("juju.juju.Controller")
+    @mock.patch("juju_spell.connections.manager.build_controller_conn")
+    async def test_connect_failed(self, mock_build_controller_conn, _):
+        """Test that connection process is cleaned if it fails to connect."""
+        config = copy.copy(self.controller_config_2)
+        connection_process = MagicMock(connect=AsyncMock(side_effect=OSError))
+        with mock.patch("juju_spell.connections.manager.get_connection") as mock_get_connection:
+            mock_get_connection.return_value = "localhost:17071", connection_process
+            with self.assertRaises(OSError):
+                await self.connect_manager._connect(config)
+
+        connection_process.clean.assert_called_once()
+        mock_build_controller_conn.assert_not_called()
+        assert config.name not in self.connect_manager.connections
+
+    @mock.patch("juju.juju.Controller")
+    @mock.patch("juju_spell.connections.manager.build_controller_conn")
+    async def test_connect_failed_login(self, mock_build_controller_conn, _):
+        """Test that connection is not registered if login to controller fails."""
+        config = copy.copy(self.controller_config_2)
+        mock_build_controller_conn.side_effect = ConnectionError
+        connection_process = AsyncMock(clean=MagicMock())
+        with mock.patch("juju_spell.connections.manager.get_connection") as mock_get_connection:
+            mock_get_connection.return_value = "localhost:17071", connection_process
+            with self.assertRaises(ConnectionError):
+                await self.connect_manager._connect(config)
+
+        connection_process.clean.assert_called_once()
+        assert config.name not in self.connect_manager.connections
+
+    @mock.patch("juju.juju.Controller")
+    @mock.patch("juju_spell.connections.manager.build_controller_conn")
+    async def test_connect_replace_connection(self, *_):
+        """Test that replaced connection is closed with its connection process."""
+        from juju_spell.connections.manager import Connection
+
+        config = copy.copy(self.controller_config_2)
+        old_connection = Connection(AsyncMock(), MagicMock())
+        self.connect_manager.connections[config.name] = old_connection
+        with mock.patch("juju_spell.connections.manager.get_connection") as mock_get_connection:
+            mock_get_connection.return_value = "localhost:17071", AsyncMock()
+            await self.connect_manager._connect(config)
+
+        old_connection.controller.disconnect.assert_awaited_once()
+        old_connection.connection_process.clean.assert_called_once()
+        assert self.connect_manager.connections[config.name] is not old_connection
+
     async def test_clean(self):
         """Test clean function."""
         from juju_spell.connections.manager import Connection
@@ -138,6 +186,23 @@ class TestConnectManager(unittest.IsolatedAsyncioTestCase):
             connection.controller.disconnect.assert_called_once()
             connection.connection_process.clean.assert_called_once()
 
+    async def test_clean_failed_disconnect(self):
+        """Test clean function closing other connections if one of them fails."""
+        from juju_spell.connections.manager import Connection
+
+        failing_connection = Connection(AsyncMock(), MagicMock())
+        failing_connection.controller.disconnect.side_effect = ConnectionError()
+        connection = Connection(AsyncMock(), MagicMock())
+        self.connect_manager.connections["test-0"] = failing_connection
+        self.connect_manager.connections["test-1"] = connection
+
+        await self.connect_manager.clean()
+
+        assert len(self.connect_manager.connections) == 0
+        for _connection in [failing_connection, connection]:
+            _connection.controller.disconnect.assert_awaited_once()
+            _connection.connection_process.clean.assert_called_once()
+
     async def test_get_controller_invalid_controller_config(self):
         """Test function to get controller with invalid controller config."""
         with pytest.raises(AssertionError):
@@ -153,16 +218,81 @@ class TestConnectManager(unittest.IsolatedAsyncioTestCase):
         mock_connect.assert_called_once_with(config, False)
         assert controller == mock_connect.return_value
 
+    async def test_get_controller_pending_connection(self):
+        """Test that concurrent calls share the same pending connection."""
+        config = self.controller_config_1
+        connected = asyncio.Event()
+
+        async def _connect(*_):
+            await connected.wait()
+            return exp_controller
+
+        exp_controller = MagicMock()
+        self.connect_manager._connect = mock_connect = AsyncMock(side_effect=_connect)
+
+        tasks = [
+            asyncio.create_task(self.connect_manager.get_controller(config)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)  # let all tasks start waiting for connection
+        connected.set()
+        controllers = await asyncio.gather(*tasks)
+
+        mock_connect.assert_called_once_with(config, False)
+        assert controllers == [exp_controller] * 3
+        assert config.name not in self.connect_manager._pending
+
+    async def test_get_controller_pending_connection_cancelled(self):
+        """Test that cancelled caller does not cancel pending connection for others."""
+        config = self.controller_config_1
+        connected = asyncio.Event()
+
+        async def _connect(*_):
+            await connected.wait()
+            return exp_controller
+
+        exp_controller = MagicMock()
+        self.connect_manager._connect = mock_connect = AsyncMock(side_effect=_connect)
+
+        first = asyncio.create_task(self.connect_manager.get_controller(config))
+        second = asyncio.create_task(self.connect_manager.get_controller(config))
+        await asyncio.sleep(0)  # let all tasks start waiting for connection
+        first.cancel()
+        connected.set()
+
+        assert await second == exp_controller
+        assert first.cancelled()
+        mock_connect.assert_called_once_with(config, False)
+
+    async def test_get_controller_pending_connection_failed(self):
+        """Test that failed connection is not shared with following callers."""
+        config = self.controller_config_1
+        exp_controller = MagicMock()
+        self.connect_manager._connect = mock_connect = AsyncMock(
+            side_effect=[ConnectionError(), exp_controller]
+        )
+
+        with pytest.raises(ConnectionError):
+            await self.connect_manager.get_controller(config)
+
+        assert config.name not in self.connect_manager._pending
+        assert await self.connect_manager.get_controller(config) == exp_controller
+        assert mock_connect.call_count == 2
+
     async def test_get_controller_reconnect(self):
         """Test function to get controller with reconnection."""
         config = self.controller_config_1
         self.connect_manager._connect = mock_connect = AsyncMock()
         self.connect_manager.connections[config.name] = mocked_connection = AsyncMock()
+        mocked_connection.expired = False
+        mocked_connection.loop = asyncio.get_running_loop()
         mocked_connection.controller.is_connected = lambda: True
 
+        mocked_connection.connection_process = MagicMock()
+
         controller = await self.connect_manager.get_controller(config, reconnect=True)
 
         mocked_connection.controller.disconnect.assert_called_once()
+        mocked_connection.connection_process.clean.assert_called_once()
         mock_connect.assert_called_once_with(config, False)
         assert controller == mock_connect.return_value
 
@@ -171,19 +301,130 @@ class TestConnectManager(unittest.IsolatedAsyncioTestCase):
         config = self.controller_config_1
         self.connect_manager._connect = mock_connect = AsyncMock()
         mocked_connection = AsyncMock()
+        mocked_connection.expired = False
+        mocked_connection.loop = asyncio.get_running_loop()
         mocked_connection.controller = mock_controller = MagicMock()
         mock_controller.is_connected.return_value = False
+        mock_controller.disconnect = AsyncMock()
+        mocked_connection.connection_process = MagicMock()
         self.connect_manager.connections[config.name] = mocked_connection
 
         controller = await self.connect_manager.get_controller(config, reconnect=False)
 
+        mocked_connection.connection_process.clean.assert_called_once()
+        mock_connect.assert_called_once_with(config, False)
+        assert controller == mock_connect.return_value
+
+    async def test_get_controller_expired_connection(self):
+        """Test function to get controller, when cached connection expired."""
+        from juju_spell.connections.manager import Connection
+
+        config = self.controller_config_1
+        self.connect_manager._connect = mock_connect = AsyncMock()
+        connection = Connection(
+            AsyncMock(), MagicMock(), last_used=0, loop=asyncio.get_running_loop()
+        )
+        connection.controller.is_connected = lambda: True
+        self.connect_manager.connections[config.name] = connection
+
+        with mock.patch("juju_spell.connections.manager.time.monotonic", return_value=301):
+            controller = await self.connect_manager.get_controller(config)
+
+        connection.controller.disconnect.assert_called_once()
+        connection.connection_process.clean.assert_called_once()
         mock_connect.assert_called_once_with(config, False)
         assert controller == mock_connect.return_value
 
+    async def test_get_controller_other_loop_connection(self):
+        """Test function to get controller, when cached connection is from other loop."""
+        from juju_spell.connections.manager import Connection
+
+        config = self.controller_config_1
+        self.connect_manager._connect = mock_connect = AsyncMock()
+        connection = Connection(AsyncMock(), MagicMock(), loop=MagicMock())
+        connection.controller.is_connected = lambda: True
+        self.connect_manager.connections[config.name] = connection
+
+        controller = await self.connect_manager.get_controller(config)
+
+        connection.controller.disconnect.assert_not_called()
+        connection.connection_process.clean.assert_called_once()
+        mock_connect.assert_called_once_with(config, False)
+        assert controller == mock_connect.return_value
+
+    async def test_get_controller_other_loop_connection_clean_failed(self):
+        """Test that failure to clean connection from other loop is not raised."""
+        from juju_spell.connections.manager import Connection
+
+        config = self.controller_config_1
+        self.connect_manager._connect = mock_connect = AsyncMock()
+        connection = Connection(AsyncMock(), MagicMock(), loop=MagicMock())
+        connection.connection_process.clean.side_effect = OSError
+        self.connect_manager.connections[config.name] = connection
+
+        controller = await self.connect_manager.get_controller(config)
+
+        assert controller == mock_connect.return_value
+        assert config.name not in self.connect_manager.connections
+
+    async def test_get_controller_evict_expired_connections(self):
+        """Test that all expired connections are closed when getting controller."""
+        from juju_spell.connections.manager import Connection
+
+        config = self.controller_config_1
+        self.connect_manager._connect = AsyncMock()
+        loop = asyncio.get_running_loop()
+        expired = Connection(AsyncMock(), MagicMock(), last_used=0, loop=loop)
+        active = Connection(AsyncMock(), MagicMock(), last_used=300, loop=loop)
+        self.connect_manager.connections["expired"] = expired
+        self.connect_manager.connections["active"] = active
+
+        with mock.patch("juju_spell.connections.manager.time.monotonic", return_value=301):
+            await self.connect_manager.get_controller(config)
+
+        assert list(self.connect_manager.connections) == ["active"]
+        expired.controller.disconnect.assert_awaited_once()
+        expired.connection_process.clean.assert_called_once()
+        active.controller.disconnect.assert_not_called()
+
+    def test_clean_at_exit(self):
+        """Test closing connections at interpreter exit in their loop."""
+        from juju_spell.connections.manager import Connection
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        connections = [Connection(AsyncMock(), MagicMock(), loop=loop) for _ in range(2)]
+        connections[0].controller.disconnect.side_effect = ConnectionError()
+        self.connect_manager.connections.update(enumerate(connections))
+
+        self.connect_manager._clean_at_exit()
+
+        assert len(self.connect_manager.connections) == 0
+        for connection in connections:
+            connection.controller.disconnect.assert_awaited_once()
+            connection.connection_process.clean.assert_called_once()
+
+    def test_clean_at_exit_closed_loop(self):
+        """Test closing connections at exit in new loop if their loop is closed."""
+        from juju_spell.connections.manager import Connection
+
+        loop = asyncio.new_event_loop()
+        loop.close()
+        connection = Connection(AsyncMock(), MagicMock(), loop=loop)
+        self.connect_manager.connections["test"] = connection
+
+        self.connect_manager._clean_at_exit()
+
+        assert len(self.connect_manager.connections) == 0
+        connection.controller.disconnect.assert_awaited_once()
+        connection.connection_process.clean.assert_called_once()
+
     async def test_get_controller_existing_controller(self):
         """Test function to get controller, which already exists."""
         config = self.controller_config_1
         self.connect_manager.connections[config.name] = mocked_connection = AsyncMock()
+        mocked_connection.expired = False
+        mocked_connection.loop = asyncio.get_running_loop()
         mocked_connection.controller.is_connected = lambda: True
 
         controller = await self.connect_manager.get_controller(config)
@@ -1,5 +1,6 @@
+import asyncio
+import concurrent.futures
 import socket
-import subprocess
 import unittest
 from unittest import mock
 
@@ -8,37 +9,59 @@ import pytest
 from juju_spell.config import Connection
 
 
-@pytest.mark.parametrize("return_code, exp_result", [(1, True), (0, False)])
+@pytest.fixture(autouse=True)
+def reserved_ports():
+    """Release all ports reserved by get_free_tcp_port after each test."""
+    from juju_spell.connections import network
+
+    yield network._reserved_ports
+    network._reserved_ports.clear()
+
+
+@pytest.mark.parametrize("bind_error, exp_result", [(None, True), (OSError, False)])
 @mock.patch("juju_spell.connections.network.socket.socket")
-def test_is_port_free(mock_socket, return_code, exp_result):
+def test_is_port_free(mock_socket, bind_error, exp_result):
     """Test function checking if port is free."""
     from juju_spell.connections.network import _is_port_free
 
     test_port = 17070
-    mock_socket.return_value = tcp = mock.MagicMock()
-    tcp.connect_ex.return_value = return_code
+    tcp = mock_socket.return_value.__enter__.return_value
+    tcp.bind.side_effect = bind_error
 
     result = _is_port_free(test_port)
 
     assert result == exp_result
     mock_socket.assert_called_once_with(socket.AF_INET, socket.SOCK_STREAM)
-    tcp.connect_ex.assert_called_once_with(("localhost", test_port))
-    tcp.close.assert_called_once()
+    tcp.bind.assert_called_once_with(("localhost", test_port))
+    mock_socket.return_value.__exit__.assert_called_once()
+
+
+def test_is_port_free_listening_port():
+    """Test that port with listening socket is not free."""
+    from juju_spell.connections.network import _is_port_free
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.bind(("localhost", 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+
+        assert _is_port_free(port) is False
 
 
 @mock.patch("juju_spell.connections.network._is_port_free")
-@mock.patch("juju_spell.connections.network.random.shuffle")
-def test_get_free_tcp_port(mock_random_shuffle, mock_is_port_free):
+@mock.patch("juju_spell.connections.network.random.randrange")
+def test_get_free_tcp_port(mock_random_randrange, mock_is_port_free):
     """Test getting free TCP port."""
     from juju_spell.connections.network import get_free_tcp_port
 
-    exp_port = 17073
+    exp_port = 17071
+    mock_random_randrange.return_value = 2
     mock_is_port_free.side_effect = [False, False, True, False]
 
     port = get_free_tcp_port(range(17071, 17075))
 
-    mock_random_shuffle.assert_called_once_with([17071, 17072, 17073, 17074])
-    mock_is_port_free.assert_has_calls([mock.call(17071), mock.call(17072), mock.call(17073)])
+    mock_random_randrange.assert_called_once_with(4)
+    mock_is_port_free.assert_has_calls([mock.call(17073), mock.call(17074), mock.call(17071)])
     assert port == exp_port
 
 
@@ -52,20 +75,78 @@ def test_get_free_tcp_port_exception(mock_is_port_free):
     with pytest.raises(ValueError):
         get_free_tcp_port(range(17071, 17075))
 
+    assert mock_is_port_free.call_count == 4
+
+
+@mock.patch("juju_spell.connections.network._is_port_free", return_value=True)
+def test_get_free_tcp_port_reserved(_, reserved_ports):
+    """Test that reserved port is not returned until it's released."""
+    from juju_spell.connections.network import get_free_tcp_port, release_tcp_port
+
+    port = get_free_tcp_port(range(17071, 17072))
+    assert reserved_ports == {port}
+
+    with pytest.raises(ValueError):
+        get_free_tcp_port(range(17071, 17072))
+
+    release_tcp_port(port)
+    assert get_free_tcp_port(range(17071, 17072)) == port
+
+
+@mock.patch("juju_spell.connections.network._is_port_free", return_value=True)
+def test_get_connection_concurrent_ports(_):
+    """Test that concurrent connections get distinct local ports."""
+    from juju_spell.connections.network import get_connection
+
+    controller_config = mock.MagicMock()
+    controller_config.connection = Connection("10.2.2.1", port_range=range(17071, 17081))
 
-def test_empty_connection():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [executor.submit(get_connection, controller_config) for _ in range(10)]
+        endpoints = [future.result()[0] for future in futures]
+
+    assert len(set(endpoints)) == 10
+
+
+def test_ssh_port_forwarding_clean_release_port(reserved_ports):
+    """Test that cleaning ssh port-forwarding releases its local port."""
+    from juju_spell.connections.network import SshPortForwardSubprocess
+
+    reserved_ports.add(17071)
+    ssh_portforward = SshPortForwardSubprocess("localhost:17071", "10.1.1.99:17070", "bastion")
+    ssh_portforward.clean()
+
+    assert 17071 not in reserved_ports
+
+
+def test_ssh_port_forwarding_clean_failed_release_port(reserved_ports):
+    """Test that local port is released even if terminating ssh fails."""
+    from juju_spell.connections.network import SshPortForwardSubprocess
+
+    reserved_ports.add(17071)
+    ssh_portforward = SshPortForwardSubprocess("localhost:17071", "10.1.1.99:17070", "bastion")
+    ssh_portforward.process = mock.MagicMock(returncode=None)
+    ssh_portforward.process.terminate.side_effect = PermissionError
+
+    with pytest.raises(PermissionError):
+        ssh_portforward.clean()
+
+    assert 17071 not in reserved_ports
+
+
+async def test_empty_connection():
     """Test EmptyConnection."""
     from juju_spell.connections.network import EmptyConnection
 
     connection = EmptyConnection()
     assert connection.is_connected is False
-    connection.connect()
+    await connection.connect()
     assert connection.is_connected is True
     connection.clean()
     assert connection.is_connected is False
 
 
-class EmptyConnectionTestCase(unittest.TestCase):
+class EmptyConnectionTestCase(unittest.IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         """Set up test cases."""
         from juju_spell.connections.network import EmptyConnection
@@ -78,10 +159,10 @@ class EmptyConnectionTestCase(unittest.TestCase):
         self.connection._connected = True
         self.assertTrue(self.connection.is_connected)
 
-    def test_connect(self):
+    async def test_connect(self):
         """Test connect function."""
         self.assertFalse(self.connection._connected)
-        self.connection.connect()
+        await self.connection.connect()
         self.assertTrue(self.connection._connected)
 
     def test_clean(self):
@@ -92,7 +173,7 @@ class EmptyConnectionTestCase(unittest.TestCase):
         self.assertFalse(self.connection._connected)
 
 
-class BaseSubprocessConnectionTestCase(unittest.TestCase):
+class BaseSubprocessConnectionTestCase(unittest.IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         """Set up test cases."""
         from juju_spell.connections.network import BaseSubprocessConnection
@@ -105,17 +186,30 @@ class BaseSubprocessConnectionTestCase(unittest.TestCase):
         self.connection.process = mock.MagicMock()
         self.assertTrue(self.connection.is_connected)
 
-    def test_connect(self):
+    async def test_connect(self):
         """Test connect function."""
         with pytest.raises(NotImplementedError):
-            self.connection.connect()
+            await self.connection.connect()
 
     def test_clean(self):
         """Test clean function."""
-        self.connection.process = mocked_process = mock.MagicMock()
+        self.connection.process = mocked_process = mock.MagicMock(returncode=None)
         self.connection.clean()
         mocked_process.terminate.assert_called_once()
 
+    def test_clean_exited_process(self):
+        """Test clean function with process, which already exited."""
+        self.connection.process = mocked_process = mock.MagicMock(returncode=255)
+        self.connection.clean()
+        mocked_process.terminate.assert_not_called()
+
+    def test_clean_process_lookup_error(self):
+        """Test clean function with process, which exited and was not awaited yet."""
+        self.connection.process = mocked_process = mock.MagicMock(returncode=None)
+        mocked_process.terminate.side_effect = ProcessLookupError
+        self.connection.clean()  # no error raised
+        mocked_process.terminate.assert_called_once()
+
 
 @pytest.mark.parametrize(
     "args, exp_cmd",
@@ -132,7 +226,8 @@ class BaseSubprocessConnectionTestCase(unittest.TestCase):
                 "-N",
                 "-L",
                 "localhost:1234:10.1.1.99:17070",
-                "-J bastion1 -J bastion2",
+                "-J",
+                "bastion1,bastion2",
             ],
         ),
         (
@@ -141,18 +236,20 @@ class BaseSubprocessConnectionTestCase(unittest.TestCase):
         ),
     ],
 )
-@mock.patch("juju_spell.connections.network.subprocess.Popen", return_value=mock.MagicMock)
-def test_ssh_port_forwarding_proc_connect(mock_popen, args, exp_cmd):
+@mock.patch("juju_spell.connections.network.asyncio.create_subprocess_exec")
+async def test_ssh_port_forwarding_proc_connect(mock_create_subprocess_exec, args, exp_cmd):
     """Test create ssh tune for port forwarding."""
-    mock_popen.return_value = mock_process = mock.MagicMock()
+    mock_create_subprocess_exec.return_value = mock_process = mock.MagicMock()
     mock_process.returncode.return_value = 0
     from juju_spell.connections.network import SshPortForwardSubprocess
 
     ssh_portforward = SshPortForwardSubprocess(*args)
-    ssh_portforward.connect()
+    await ssh_portforward.connect()
 
     assert ssh_portforward.is_connected is True
-    mock_popen.assert_called_once_with(exp_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    mock_create_subprocess_exec.assert_awaited_once_with(
+        *exp_cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+    )
 
 
 @pytest.mark.parametrize(
@@ -166,7 +263,8 @@ def test_ssh_port_forwarding_proc_connect(mock_popen, args, exp_cmd):
                 "10.1.1.0/24",
                 "-r",
                 "bastion",
-                "-e 'ssh -J bastion1 -J bastion2'",
+                "-e",
+                "ssh -J bastion1,bastion2",
             ],
         ),
         (
@@ -175,15 +273,17 @@ def test_ssh_port_forwarding_proc_connect(mock_popen, args, exp_cmd):
         ),
     ],
 )
-@mock.patch("juju_spell.connections.network.subprocess.Popen")
-def test_sshuttle_proc(mock_popen, args, exp_cmd):
+@mock.patch("juju_spell.connections.network.asyncio.create_subprocess_exec")
+async def test_sshuttle_proc(mock_create_subprocess_exec, args, exp_cmd):
     """Test create sshuttle connection."""
     from juju_spell.connections.network import SshuttleSubprocess
 
     sshuttle = SshuttleSubprocess(*args)
-    sshuttle.connect()
+    await sshuttle.connect()
 
-    mock_popen.assert_called_once_with(exp_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    mock_create_subprocess_exec.assert_awaited_once_with(
+        *exp_cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+    )
 
 
 @pytest.mark.parametrize(
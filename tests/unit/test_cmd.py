@@ -1,9 +1,15 @@
+import asyncio
 from unittest import mock
 
 import pytest
 from craft_cli import Dispatcher
 
-from juju_spell.cmd import GLOBAL_ARGS, _run_dispatcher, get_command_groups
+from juju_spell.cmd import (
+    GLOBAL_ARGS,
+    _run_dispatcher,
+    _set_event_loop,
+    get_command_groups,
+)
 from juju_spell.settings import APP_NAME, APP_VERSION, CONFIG_PATH, PERSONAL_CONFIG_PATH
 
 
@@ -42,3 +48,28 @@ def test_run_dispatcher(mock_load_config, mock_emit, mock_sys, cli_args):
 
         dispatcher.load_command.assert_called_once_with(mock_load_config.return_value)
         dispatcher.run.assert_called_once()
+
+
+@mock.patch("juju_spell.cmd.asyncio.set_event_loop")
+def test_set_event_loop_uvloop(mock_set_event_loop):
+    """Test setting uvloop event loop."""
+    mock_uvloop = mock.MagicMock()
+
+    with mock.patch.dict("sys.modules", {"uvloop": mock_uvloop}):
+        _set_event_loop()
+
+    mock_uvloop.new_event_loop.assert_called_once_with()
+    mock_set_event_loop.assert_called_once_with(mock_uvloop.new_event_loop.return_value)
+
+
+@mock.patch("juju_spell.cmd.asyncio.set_event_loop")
+def test_set_event_loop_missing_uvloop(mock_set_event_loop):
+    """Test setting default event loop if uvloop is missing."""
+    with mock.patch.dict("sys.modules", {"uvloop": None}):
+        _set_event_loop()  # no ImportError raised
+
+    mock_set_event_loop.assert_called_once()
+    loop = mock_set_event_loop.call_args.args[0]
+    loop.close()
+    assert isinstance(loop, asyncio.AbstractEventLoop)
+    assert type(loop).__module__.startswith("asyncio")
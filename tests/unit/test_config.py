@@ -1,4 +1,4 @@
-import io
+import re
 import uuid
 from typing import Any, Dict
 from unittest import mock
@@ -9,6 +9,7 @@ from confuse import ConfigTypeError, ConfigView, MappingTemplate
 
 from juju_spell.config import (
     API_ENDPOINT_REGEX,
+    CA_CERT_REGEX,
     DESTINATION_REGEX,
     JUJUSPELL_DEFAULT_CONFIG_TEMPLATE,
     SUBNET_REGEX,
@@ -26,6 +27,10 @@ from juju_spell.exceptions import JujuSpellError
 from juju_spell.utils import load_yaml_file
 from tests.unit.conftest import TEST_CONFIG, TEST_PERSONAL_CONFIG
 
+EXPECTED_CONFIGS = {
+    config_yaml: yaml.safe_load(config_yaml) for config_yaml in [TEST_CONFIG, TEST_PERSONAL_CONFIG]
+}
+
 
 @pytest.mark.parametrize(
     "regex, value",
@@ -35,6 +40,8 @@ from tests.unit.conftest import TEST_CONFIG, TEST_PERSONAL_CONFIG
         (UUID_REGEX, "e53042ba-8ff5-456c-85b8-f7fef37bff5c"),
         (DESTINATION_REGEX, "maas3.frodo-baggins.mordor"),
         (API_ENDPOINT_REGEX, "10.1.1.177:17070"),  # test IPV4 endpoint
+        (CA_CERT_REGEX, "-----BEGIN CERTIFICATE-----\nAB\nCD\n-----END CERTIFICATE-----"),
+        (re.compile(UUID_REGEX), "e53042ba-8ff5-456c-85b8-f7fef37bff5c"),  # compiled pattern
     ],
 )
 def test_string(regex, value):
@@ -44,7 +51,15 @@ def test_string(regex, value):
     assert string.convert(value, view) == value
 
 
-@pytest.mark.parametrize("regex, value", [(SUBNET_REGEX, "1.2"), (UUID_REGEX, "1-2-3-4-5")])
+@pytest.mark.parametrize(
+    "regex, value",
+    [
+        (SUBNET_REGEX, "1.2"),
+        (SUBNET_REGEX, "1" * 500),
+        (UUID_REGEX, "1-2-3-4-5"),
+        (CA_CERT_REGEX, "-----BEGIN CERTIFICATE-----\n" + "A" * 2000 + "\n-----END CERT"),
+    ],
+)
 def test_string_exception(regex, value):
     """Test custom string option."""
     string = String(regex, "test message")
@@ -327,15 +342,25 @@ def test_merge_configs(config, personal_config, result):
     assert new_config == result
 
 
+@pytest.fixture(scope="session")
+def config_paths(tmp_path_factory):
+    """Write the test configs once and map each one to its file path."""
+    paths = {}
+    for config_yaml in [TEST_CONFIG, TEST_PERSONAL_CONFIG]:
+        file_path = tmp_path_factory.mktemp("config") / f"{uuid.uuid4()}.config"
+        with open(file_path, "w", encoding="utf8") as file:
+            file.write(config_yaml)
+
+        paths[config_yaml] = file_path
+
+    return paths
+
+
 @pytest.mark.parametrize("config_yaml", [TEST_CONFIG, TEST_PERSONAL_CONFIG])
-def test_load_config_file(tmp_path, config_yaml):
+def test_load_config_file(config_paths, config_yaml):
     """Test load_config_file."""
-    file_path = tmp_path / f"{uuid.uuid4()}.config"
-    with open(file_path, "w", encoding="utf8") as file:
-        file.write(config_yaml)
-
-    result = load_yaml_file(file_path)
-    assert result == yaml.safe_load(io.StringIO(config_yaml))
+    result = load_yaml_file(config_paths[config_yaml])
+    assert result == EXPECTED_CONFIGS[config_yaml]
 
 
 @pytest.mark.parametrize(